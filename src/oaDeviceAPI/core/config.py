@@ -2,16 +2,38 @@
 
 import os
 import platform
+import re
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 from .config_schema import AppConfig
 
 # App version
 APP_VERSION = "1.0.0"
 
+# ``ID=`` and ``ID_LIKE=`` lines of /etc/os-release, optionally quoted
+_OS_RELEASE_ID_RE = re.compile(r'^ID(?:_LIKE)?="?([^"\n]+)', re.MULTILINE)
 
+
+def _read_small_file(path: str, max_bytes: int = 4096) -> str:
+    """Read a small procfs/etc file with a single unbuffered read() call."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, max_bytes).decode(errors="replace")
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=1)
 def detect_platform() -> str:
-    """Detect the current platform."""
+    """Detect the current platform.
+
+    Hardware and OS identity do not change within a process, so the result is
+    cached. Call ``detect_platform.cache_clear()`` to force re-detection.
+    """
     try:
         # Check for manual override first
         platform_override = os.getenv("PLATFORM_OVERRIDE")
@@ -27,20 +49,23 @@ def detect_platform() -> str:
             # Try to detect if it's an OrangePi
             try:
                 # Check for OrangePi-specific files or hardware
-                with open("/proc/device-tree/model") as f:
-                    model = f.read().strip()
-                    if "orange" in model.lower() or "pi" in model.lower():
-                        return "orangepi"
+                model = _read_small_file("/proc/device-tree/model").strip()
+                if "orange" in model.lower() or "pi" in model.lower():
+                    return "orangepi"
             except (FileNotFoundError, PermissionError):
                 pass
 
             # Check for Ubuntu/Debian (common on OrangePi)
             if os.path.exists("/etc/os-release"):
                 try:
-                    with open("/etc/os-release") as f:
-                        content = f.read().lower()
-                        if "ubuntu" in content or "debian" in content:
-                            return "orangepi"  # Assume OrangePi for Ubuntu/Debian
+                    content = _read_small_file("/etc/os-release")
+                    distro_ids = {
+                        distro_id
+                        for match in _OS_RELEASE_ID_RE.finditer(content)
+                        for distro_id in match.group(1).lower().split()
+                    }
+                    if distro_ids & {"ubuntu", "debian"}:
+                        return "orangepi"  # Assume OrangePi for Ubuntu/Debian
                 except (FileNotFoundError, PermissionError):
                     pass
 
@@ -52,42 +77,45 @@ def detect_platform() -> str:
         return "unknown"
 
 
-def get_platform_config(platform_name: str | None = None) -> dict:
-    """Get configuration for the specified platform."""
+# Per-platform configuration is static data, so it is built once at import
+# and shared as read-only views rather than rebuilt on every lookup
+_PLATFORM_CONFIGS: dict[str, Mapping[str, Any]] = {
+    "macos": MappingProxyType({
+        "service_manager": "launchctl",
+        "bin_paths": ("/usr/local/bin", "/opt/homebrew/bin"),
+        "temp_dir": "/tmp",
+        "screenshot_supported": False,
+        "camera_supported": True,
+        "tracker_supported": True,
+        "camguard_supported": True,
+    }),
+    "orangepi": MappingProxyType({
+        "service_manager": "systemctl",
+        "bin_paths": ("/usr/bin", "/usr/local/bin"),
+        "temp_dir": "/tmp",
+        "screenshot_supported": True,
+        "camera_supported": False,
+        "tracker_supported": False,
+        "camguard_supported": False,
+    }),
+    "linux": MappingProxyType({
+        "service_manager": "systemctl",
+        "bin_paths": ("/usr/bin", "/usr/local/bin"),
+        "temp_dir": "/tmp",
+        "screenshot_supported": False,
+        "camera_supported": False,
+        "tracker_supported": False,
+        "camguard_supported": False,
+    }),
+}
+
+
+def get_platform_config(platform_name: str | None = None) -> Mapping[str, Any]:
+    """Get the read-only configuration for the specified platform."""
     if platform_name is None:
         platform_name = DETECTED_PLATFORM
 
-    platform_configs = {
-        "macos": {
-            "service_manager": "launchctl",
-            "bin_paths": ["/usr/local/bin", "/opt/homebrew/bin"],
-            "temp_dir": "/tmp",
-            "screenshot_supported": False,
-            "camera_supported": True,
-            "tracker_supported": True,
-            "camguard_supported": True,
-        },
-        "orangepi": {
-            "service_manager": "systemctl",
-            "bin_paths": ["/usr/bin", "/usr/local/bin"],
-            "temp_dir": "/tmp",
-            "screenshot_supported": True,
-            "camera_supported": False,
-            "tracker_supported": False,
-            "camguard_supported": False,
-        },
-        "linux": {
-            "service_manager": "systemctl",
-            "bin_paths": ["/usr/bin", "/usr/local/bin"],
-            "temp_dir": "/tmp",
-            "screenshot_supported": False,
-            "camera_supported": False,
-            "tracker_supported": False,
-            "camguard_supported": False,
-        }
-    }
-
-    return platform_configs.get(platform_name.lower(), platform_configs["linux"])
+    return _PLATFORM_CONFIGS.get(platform_name.lower(), _PLATFORM_CONFIGS["linux"])
 
 
 # Initialize configuration with platform detection
@@ -135,6 +163,11 @@ TRACKER_ROOT = settings.tracker_root_dir
 TRACKER_API_URL = settings.tracker_api_url
 CACHE_TTL = 30
 
+# Time budget in seconds for each health collector. A collector that overruns
+# it is reported as unknown rather than holding up the whole health response.
+# Must leave room for the one-second CPU sample in the metrics collectors.
+HEALTH_COLLECTOR_TIMEOUT = 5.0
+
 # Health scoring configuration
 HEALTH_SCORE_WEIGHTS = {
     'cpu': 0.25,
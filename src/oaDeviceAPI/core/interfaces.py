@@ -69,8 +69,8 @@ class PlatformManagerInterface(Protocol):
         """Check if running on Linux."""
         ...
 
-    def get_service_manager(self) -> str:
-        """Get the service manager name for this platform."""
+    def get_service_manager(self) -> str | None:
+        """Get the service manager name for this platform, if configured."""
         ...
 
 
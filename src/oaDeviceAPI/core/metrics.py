@@ -7,6 +7,8 @@ Eliminates code duplication between macOS and OrangePi metrics services.
 """
 
 import platform
+import threading
+import time
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
 from typing import Any, Protocol, runtime_checkable
@@ -29,6 +31,33 @@ from .config import APP_VERSION
 from .error_handler import ErrorHandler
 from .exceptions import ErrorSeverity, MetricsCollectionError
 
+# psutil.cpu_percent(interval=1) blocks for a full second, so every caller in
+# the process shares the last per-core reading
+_CPU_SAMPLE: dict[str, Any] = {"ts": None, "per_core": []}
+_cpu_sample_lock = threading.Lock()
+
+
+def sample_cpu_usage(max_age: float) -> tuple[float, list[float]]:
+    """Return overall and per-core CPU usage from one shared one-second sample.
+
+    The sample is reused for up to ``max_age`` seconds, so readings can be that
+    stale. Concurrent callers wait for the sample already in flight instead of
+    blocking on one of their own. The overall figure is the per-core mean,
+    which keeps both values on the same time window.
+    """
+    with _cpu_sample_lock:
+        now = time.monotonic()
+        if _CPU_SAMPLE["ts"] is None or now - _CPU_SAMPLE["ts"] >= max_age:
+            _CPU_SAMPLE.update(ts=now, per_core=psutil.cpu_percent(interval=1, percpu=True))
+        per_core: list[float] = list(_CPU_SAMPLE["per_core"])
+    overall = round(sum(per_core) / len(per_core), 1) if per_core else 0.0
+    return overall, per_core
+
+
+def sample_cpu_percent(max_age: float) -> float:
+    """Return overall CPU usage from the shared sample (see ``sample_cpu_usage``)."""
+    return sample_cpu_usage(max_age)[0]
+
 
 @runtime_checkable
 class PlatformMetricsProvider(Protocol):
@@ -69,12 +98,16 @@ class BaseMetricsCollector(ABC):
         self._last_collection = {}
         self._cached_metrics = {}
 
+    def _sample_cpu_percent(self) -> float:
+        """Sample CPU usage, reusing the shared sample for up to the cache TTL."""
+        return sample_cpu_percent(self._cache_ttl)
+
     @ErrorHandler.handle_errors(convert_exceptions=True)
     def get_standardized_cpu_metrics(self) -> BaseCPUMetrics:
         """Get CPU metrics in standardized format."""
         try:
             # Get base CPU metrics
-            cpu_usage = psutil.cpu_percent(interval=1)
+            cpu_usage = self._sample_cpu_percent()
             cpu_cores = psutil.cpu_count()
             cpu_model = platform.processor()
 
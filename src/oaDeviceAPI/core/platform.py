@@ -1,81 +1,210 @@
 """Platform detection and management utilities."""
 
 import logging
+import re
 import subprocess
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any
 
-from .config import DETECTED_PLATFORM, get_platform_config
+from . import config
 
 logger = logging.getLogger(__name__)
 
+# Service state line in `launchctl print` output, e.g. "\tstate = running"
+_LAUNCHCTL_STATE = re.compile(r"^\s*state[ \t]*=[ \t]*(\S+)", re.MULTILINE)
+
+# Features reported by get_available_features(), in display order
+_KNOWN_FEATURES = ("screenshot", "camera", "tracker", "camguard")
+
+
+@lru_cache(maxsize=1)
+def _detect_platform_cached() -> tuple[str, Mapping[str, Any]]:
+    """Resolve the detected platform and its config once per process."""
+    platform_name = config.DETECTED_PLATFORM
+    return platform_name, config.get_platform_config(platform_name)
+
+
+@lru_cache(maxsize=1)
+def _get_process_uid() -> str:
+    """Look up the uid of the user running the API once per process."""
+    return subprocess.getoutput("id -u").strip()
+
+
+def _coerce_bin_paths(bin_paths: Any) -> tuple[str, ...] | None:
+    """Return configured bin paths as a tuple of strings, or None if malformed."""
+    if isinstance(bin_paths, (list, tuple)) and all(isinstance(path, str) for path in bin_paths):
+        return tuple(bin_paths)
+    return None
+
 
 class PlatformManager:
     """Manages platform-specific operations and feature availability."""
 
-    def __init__(self):
-        self.platform = DETECTED_PLATFORM
-        self.config = get_platform_config(self.platform)
+    # Seconds a service status result is reused before querying again
+    SERVICE_STATUS_TTL = 2.0
+    # Upper bound on concurrent launchctl queries when checking several services
+    SERVICE_QUERY_WORKERS = 4
+
+    def __init__(
+        self,
+        *,
+        runner: Callable[..., subprocess.CompletedProcess] | None = None,
+        user_id_getter: Callable[[str], str] | None = None,
+    ):
+        # Both default to the subprocess functions looked up at call time
+        self._runner = runner
+        self._user_id_getter = user_id_getter
+        self.platform, platform_config = _detect_platform_cached()
+        # Private copy so per-instance tweaks never leak into the shared config
+        self.config = dict(platform_config or {})
+
+        # Platform identity and feature flags are fixed for the lifetime of the
+        # manager, so resolve them once instead of on every query
+        self._is_macos = self.platform == "macos"
+        self._is_orangepi = self.platform == "orangepi"
+        self._is_linux = self.platform in ("linux", "orangepi")
+        self._features = frozenset(
+            key.removesuffix("_supported")
+            for key, enabled in self.config.items()
+            if key.endswith("_supported") and enabled
+        )
+        self._service_manager = self.config.get("service_manager")
+        self._bin_paths = _coerce_bin_paths(self.config.get("bin_paths"))
+        self._status_cache: dict[str, tuple[float, bool]] = {}
         logger.info(f"Detected platform: {self.platform}")
 
+    @classmethod
+    def _reset_cache(cls) -> None:
+        """Forget the cached platform and uid so the next manager re-reads them."""
+        _detect_platform_cached.cache_clear()
+        _get_process_uid.cache_clear()
+
     def is_macos(self) -> bool:
         """Check if running on macOS."""
-        return self.platform == "macos"
+        return self._is_macos
 
     def is_orangepi(self) -> bool:
         """Check if running on OrangePi."""
-        return self.platform == "orangepi"
+        return self._is_orangepi
 
     def is_linux(self) -> bool:
         """Check if running on Linux (generic)."""
-        return self.platform in ["linux", "orangepi"]
+        return self._is_linux
 
     def supports_feature(self, feature: str) -> bool:
         """Check if the current platform supports a specific feature."""
-        return self.config.get(f"{feature}_supported", False)
+        return feature in self._features
 
-    def get_service_manager(self) -> str:
+    def get_service_manager(self) -> str | None:
         """Get the service manager for the current platform."""
-        return self.config["service_manager"]
+        return self._service_manager
 
-    def get_bin_paths(self) -> list[str]:
-        """Get binary search paths for the current platform."""
-        return self.config["bin_paths"]
+    def get_bin_paths(self) -> tuple[str, ...] | None:
+        """Get binary search paths for the current platform; None if unset or malformed."""
+        return self._bin_paths
 
-    def get_temp_dir(self) -> str:
+    def get_temp_dir(self) -> str | None:
         """Get temporary directory for the current platform."""
-        return self.config["temp_dir"]
+        return self.config.get("temp_dir")
 
     def check_service_status(self, service_name: str) -> bool | None:
-        """Check if a service is running on the current platform."""
-        try:
-            if self.is_macos():
-                # Use launchctl for macOS
-                cmd = ["launchctl", "print", f"gui/{subprocess.getoutput('id -u')}/{service_name}"]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-                return "state = running" in result.stdout
+        """Check if a service is running on the current platform.
+
+        Results are reused for SERVICE_STATUS_TTL seconds so bursts of status
+        polling do not fork a launchctl/systemctl process per request.
+        """
+        return self.check_service_statuses([service_name])[service_name]
+
+    def check_service_statuses(self, service_names: list[str]) -> dict[str, bool | None]:
+        """Check several services at once, keyed by service name.
+
+        Cached results are reused as in check_service_status(); the remaining
+        services are queried together, in a single systemctl call on Linux.
+        """
+        now = time.monotonic()
+        statuses: dict[str, bool | None] = {}
+        pending = []
+        for name in dict.fromkeys(service_names):
+            cached = self._status_cache.get(name)
+            if cached is not None and now - cached[0] < self.SERVICE_STATUS_TTL:
+                statuses[name] = cached[1]
             else:
-                # Use systemctl for Linux
-                cmd = ["systemctl", "is-active", service_name]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-                return result.stdout.strip() == "active"
+                pending.append(name)
+
+        if pending:
+            for name, status in self._query_service_statuses(pending).items():
+                statuses[name] = status
+                if status is not None:
+                    self._status_cache[name] = (now, status)
+        return {name: statuses[name] for name in service_names}
+
+    def clear_status_cache(self) -> None:
+        """Forget cached service statuses so the next check queries the system."""
+        self._status_cache.clear()
+
+    def _run(self, cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        """Run a service-manager command through the configured runner."""
+        return (self._runner or subprocess.run)(cmd, **kwargs)
+
+    def _get_user_id(self) -> str:
+        """Get the current user's uid for the launchctl GUI domain."""
+        if self._user_id_getter is not None:
+            return self._user_id_getter("id -u")
+        return _get_process_uid()
+
+    def _query_service_status(self, service_name: str) -> bool | None:
+        """Query launchctl for a single service's current status."""
+        try:
+            cmd = ["launchctl", "print", f"gui/{self._get_user_id()}/{service_name}"]
+            result = self._run(cmd, capture_output=True, text=True, timeout=10)
+            match = _LAUNCHCTL_STATE.search(result.stdout)
+            return bool(match and match.group(1) == "running")
         except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
             logger.warning(f"Could not check status of service {service_name}")
             return None
 
+    def _query_service_statuses(self, service_names: list[str]) -> dict[str, bool | None]:
+        """Query the service manager for the current status of each service."""
+        if self.is_macos():
+            # launchctl print takes one service target per invocation, so
+            # overlap the calls instead of waiting on each one in turn
+            if len(service_names) == 1:
+                return {service_names[0]: self._query_service_status(service_names[0])}
+            workers = min(len(service_names), self.SERVICE_QUERY_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                statuses = executor.map(self._query_service_status, service_names)
+                return dict(zip(service_names, statuses, strict=True))
+
+        # systemctl is-active prints one state line per unit, in argument order
+        try:
+            cmd = ["systemctl", "is-active", *service_names]
+            result = self._run(cmd, capture_output=True, text=True, timeout=10)
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
+            logger.warning(f"Could not check status of services {', '.join(service_names)}")
+            return dict.fromkeys(service_names)
+
+        states = result.stdout.split("\n")
+        return {
+            name: index < len(states) and states[index].strip() == "active"
+            for index, name in enumerate(service_names)
+        }
+
     def restart_service(self, service_name: str) -> bool:
         """Restart a service on the current platform."""
+        self._status_cache.pop(service_name, None)
         try:
             if self.is_macos():
-                # Use launchctl for macOS
-                stop_cmd = ["launchctl", "stop", service_name]
-                start_cmd = ["launchctl", "start", service_name]
-
-                subprocess.run(stop_cmd, capture_output=True, timeout=10)
-                result = subprocess.run(start_cmd, capture_output=True, timeout=10)
+                # kickstart -k stops and restarts the job in a single launchctl call
+                cmd = ["launchctl", "kickstart", "-k", f"gui/{self._get_user_id()}/{service_name}"]
+                result = self._run(cmd, capture_output=True, timeout=30)
                 return result.returncode == 0
             else:
                 # Use systemctl for Linux
                 cmd = ["sudo", "systemctl", "restart", service_name]
-                result = subprocess.run(cmd, capture_output=True, timeout=30)
+                result = self._run(cmd, capture_output=True, timeout=30)
                 return result.returncode == 0
         except (subprocess.TimeoutExpired, subprocess.SubprocessError):
             logger.error(f"Failed to restart service {service_name}")
@@ -83,13 +212,7 @@ class PlatformManager:
 
     def get_available_features(self) -> dict[str, bool]:
         """Get all available features for the current platform."""
-        features = [
-            "screenshot",
-            "camera",
-            "tracker",
-            "camguard"
-        ]
-        return {feature: self.supports_feature(feature) for feature in features}
+        return {feature: feature in self._features for feature in _KNOWN_FEATURES}
 
     def get_platform_info(self) -> dict[str, any]:
         """Get comprehensive platform information."""
@@ -103,5 +226,11 @@ class PlatformManager:
         }
 
 
+@lru_cache(maxsize=1)
+def get_platform_manager() -> PlatformManager:
+    """Get the process-wide PlatformManager instance, creating it on first use."""
+    return PlatformManager()
+
+
 # Global platform manager instance
-platform_manager = PlatformManager()
+platform_manager = get_platform_manager()
@@ -1,9 +1,12 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator, Callable
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from ....core.config import settings
+from ....core.config import HEALTH_COLLECTOR_TIMEOUT, settings
 from ....core.utils import cache_with_ttl
 from ....models.health_schemas import MacOSHealthResponse, StandardizedErrorResponse
 
@@ -41,32 +44,97 @@ def get_cached_deployment_info() -> dict:
     return get_deployment_info()
 
 
+@cache_with_ttl(CACHE_TTL)
+def get_cached_device_info() -> dict:
+    return get_device_info()
+
+
+async def _run_collector[T](collector: Callable[[], T], fallback: T | None = None) -> T:
+    """Run a blocking collector in a worker thread within HEALTH_COLLECTOR_TIMEOUT.
+
+    On timeout, return ``fallback``; collectors without one raise TimeoutError.
+    A worker thread cannot be cancelled, so a timed-out collector keeps running
+    in the background and holds a default-executor slot until it returns.
+    """
+    try:
+        # wait_for only stops waiting; the subprocess timeouts inside the
+        # collectors are what eventually free the thread
+        return await asyncio.wait_for(asyncio.to_thread(collector), HEALTH_COLLECTOR_TIMEOUT)
+    except TimeoutError:
+        if fallback is None:
+            raise TimeoutError(
+                f"{collector.__name__} timed out after {HEALTH_COLLECTOR_TIMEOUT}s"
+            ) from None
+        return fallback
+
+
+def _status_from_tracker(tracker: dict) -> str:
+    """Derive the basic online/maintenance/offline status from tracker health."""
+    if tracker["healthy"]:
+        return "online"
+    return "maintenance" if tracker["service_status"] == "active" else "offline"
+
+
+def _stream_status() -> dict:
+    tracker = check_tracker_status()
+    return {"status": _status_from_tracker(tracker), "tracker": tracker}
+
+
+# Sections emitted by /health/stream, each produced by one blocking collector;
+# lambdas look the collectors up at request time
+_STREAM_SECTIONS = {
+    "status": _stream_status,
+    "metrics": lambda: get_standardized_health_metrics().dict(),
+    "system": lambda: get_standardized_system_info().dict(),
+    "device_info": lambda: get_standardized_device_info().dict(),
+    "version": lambda: get_standardized_version_info().dict(),
+    "capabilities": lambda: get_standardized_capabilities().dict(),
+    "deployment": lambda: get_cached_deployment_info(),
+    "display": lambda: get_cached_display_info(),
+}
+
+
 @router.get("/health", response_model=MacOSHealthResponse)
 async def health_check():
     """Get comprehensive system health status and raw metrics using standardized schemas."""
     try:
-        # Get standardized metrics
-        standardized_metrics = get_standardized_health_metrics()
-        standardized_system = get_standardized_system_info()
-        standardized_device = get_standardized_device_info()
-        standardized_version = get_standardized_version_info()
-        standardized_capabilities = get_standardized_capabilities()
-
-        # Use cached versions of expensive operations for additional data
-        deployment = get_cached_deployment_info()
-        display_info = get_cached_display_info()
-        tracker = check_tracker_status()  # Don't cache this as it needs to be real-time
-        device = get_device_info()
+        # The collectors are independent and mostly block on subprocesses or
+        # psutil sampling, so start them all in worker threads before awaiting
+        # any; separate tasks keep each result's type
+        metrics_task = asyncio.create_task(_run_collector(get_standardized_health_metrics))
+        system_task = asyncio.create_task(_run_collector(get_standardized_system_info))
+        device_info_task = asyncio.create_task(_run_collector(get_standardized_device_info))
+        version_task = asyncio.create_task(_run_collector(get_standardized_version_info))
+        capabilities_task = asyncio.create_task(_run_collector(get_standardized_capabilities))
+        # Use cached versions of expensive operations for additional data;
+        # a stalled one is reported as unknown instead of failing the check
+        unknown: dict = {"status": "unknown"}
+        deployment_task = asyncio.create_task(_run_collector(get_cached_deployment_info, unknown))
+        display_task = asyncio.create_task(_run_collector(get_cached_display_info, unknown))
+        # Don't cache the tracker check as it needs to be real-time
+        tracker_fallback: dict = {
+            "healthy": False,
+            "service_status": "unknown",
+            "tracker_status": "unknown",
+        }
+        tracker_task = asyncio.create_task(_run_collector(check_tracker_status, tracker_fallback))
+        device_task = asyncio.create_task(_run_collector(get_cached_device_info, unknown))
+
+        standardized_metrics = await metrics_task
+        standardized_system = await system_task
+        standardized_device = await device_info_task
+        standardized_version = await version_task
+        standardized_capabilities = await capabilities_task
+        deployment = await deployment_task
+        display_info = await display_task
+        tracker = await tracker_task
+        device = await device_task
 
         # Get current time in UTC
         now = datetime.now(UTC)
 
         # Determine basic status from tracker health (for backward compatibility)
-        status = "online"
-        if not tracker["healthy"]:
-            status = (
-                "maintenance" if tracker["service_status"] == "active" else "offline"
-            )
+        status = _status_from_tracker(tracker)
 
         # Format response using standardized schemas while maintaining backward compatibility
         return {
@@ -96,6 +164,7 @@ async def health_check():
                 "metrics": get_cached_metrics.cache_info(),
                 "display": get_cached_display_info.cache_info(),
                 "deployment": get_cached_deployment_info.cache_info(),
+                "device": get_cached_device_info.cache_info(),
             },
         }
     except Exception as e:
@@ -124,6 +193,34 @@ async def health_summary():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/health/stream")
+async def health_stream() -> StreamingResponse:
+    """Stream health sections as NDJSON lines, each sent as soon as its collector finishes.
+
+    A section that times out is reported as unknown, but its collector thread
+    keeps running until it returns (see ``_run_collector``).
+    """
+
+    async def collect(section: str, collector: Callable[[], dict]) -> dict:
+        try:
+            return {"section": section, "data": await _run_collector(collector)}
+        except TimeoutError:
+            return {
+                "section": section,
+                "status": "unknown",
+                "error": f"{section} timed out after {HEALTH_COLLECTOR_TIMEOUT}s",
+            }
+        except Exception as e:
+            return {"section": section, "error": str(e)}
+
+    async def stream_generator() -> AsyncIterator[str]:
+        pending = [collect(section, collector) for section, collector in _STREAM_SECTIONS.items()]
+        for next_section in asyncio.as_completed(pending):
+            yield json.dumps(await next_section, default=str) + "\n"
+
+    return StreamingResponse(stream_generator(), media_type="application/x-ndjson")
+
+
 @router.get("/temperature")
 async def temperature_metrics():
     """Get detailed temperature metrics for the macOS device."""
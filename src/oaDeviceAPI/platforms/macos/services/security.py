@@ -9,7 +9,7 @@ import json
 import os
 import re
 
-from .utils import run_command
+from .utils import run_command, sysctl_str
 
 
 def check_filevault_status() -> dict:
@@ -371,7 +371,7 @@ def check_secure_boot() -> dict:
         # Check if this is Apple Silicon
         is_apple_silicon = False
         try:
-            processor_output = run_command(["sysctl", "-n", "machdep.cpu.brand_string"])
+            processor_output = sysctl_str("machdep.cpu.brand_string")
             is_apple_silicon = "Apple" in processor_output
         except Exception:
             pass
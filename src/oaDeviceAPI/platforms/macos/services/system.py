@@ -1,24 +1,72 @@
+import copy
 import os
 import platform
 import re
+import time
 from datetime import UTC, datetime
+from functools import lru_cache
 
 import psutil
 
 from ....core.config import LAUNCHCTL_CMD, TRACKER_ROOT
+from ....core.metrics import sample_cpu_usage
 from .temperature import get_temperature_metrics
 from .utils import run_command
 
+# Hostname patterns, e.g. 'mac0001' -> series 'mac', number '0001'
+_SERIES_NUMBER_RE = re.compile(r"^([a-z]+)(\d+)$")
+_SERIES_PREFIX_RE = re.compile(r"^([a-zA-Z]+)")
+
+# Short-lived memo of the last full metrics collection; polling clients call
+# get_system_metrics() in bursts and each collection walks every interface.
+_METRICS_TTL = float(os.getenv("OA_METRICS_TTL", "1.0"))
+_METRICS_CACHE: dict = {"ts": 0.0, "value": None}
+
+# net_connections() scans every open socket, so its count is refreshed slowly
+_NET_CONN_TTL = float(os.getenv("OA_NET_CONN_TTL", "15.0"))
+_NET_CONN_CACHE: dict = {"ts": 0.0, "value": None}
+
+
+@lru_cache(maxsize=1)
+def _cached_boot_time() -> float:
+    """Return the boot timestamp, which is fixed for the life of the process."""
+    return psutil.boot_time()
+
+
+@lru_cache(maxsize=1)
+def _cached_cpu_count() -> int | None:
+    """Return the logical CPU count, which is fixed for the life of the process."""
+    return psutil.cpu_count()
+
+
+def _throttled_net_connections() -> int:
+    """Return the open connection count, re-scanned at most every ``OA_NET_CONN_TTL`` seconds."""
+    now = time.monotonic()
+    if _NET_CONN_CACHE["value"] is None or now - _NET_CONN_CACHE["ts"] >= _NET_CONN_TTL:
+        _NET_CONN_CACHE.update(ts=now, value=len(psutil.net_connections()))
+    return _NET_CONN_CACHE["value"]
+
 
 def get_system_metrics() -> dict:
-    """Get comprehensive system metrics including CPU, memory, disk, and network usage."""
+    """Get comprehensive system metrics including CPU, memory, disk, and network usage.
+
+    Successful collections are reused for ``OA_METRICS_TTL`` seconds; every
+    caller gets its own copy, so mutating the result cannot leak into others.
+    """
+    now = time.monotonic()
+    if _METRICS_CACHE["value"] is not None and now - _METRICS_CACHE["ts"] < _METRICS_TTL:
+        return copy.deepcopy(_METRICS_CACHE["value"])
+
     try:
         # Get base metrics (keeping existing structure)
+        # CPU usage is at most OA_METRICS_TTL seconds older than the collection
+        cpu_percent, per_core = sample_cpu_usage(_METRICS_TTL)
+        cpu_freq = psutil.cpu_freq()
         cpu_metrics = {
-            "percent": psutil.cpu_percent(interval=1),
-            "cores": psutil.cpu_count(),
-            "frequency": psutil.cpu_freq()._asdict() if psutil.cpu_freq() else None,
-            "per_core": psutil.cpu_percent(interval=1, percpu=True),
+            "percent": cpu_percent,
+            "cores": _cached_cpu_count(),
+            "frequency": cpu_freq._asdict() if cpu_freq else None,
+            "per_core": per_core,
         }
 
         memory = psutil.virtual_memory()
@@ -57,7 +105,7 @@ def get_system_metrics() -> dict:
         try:
             network_metrics = {
                 "interfaces": {},
-                "connections": len(psutil.net_connections()),
+                "connections": _throttled_net_connections(),
             }
 
             # Get network interface stats
@@ -99,19 +147,21 @@ def get_system_metrics() -> dict:
                 "error": str(e)
             }
 
-        return {
+        metrics = {
             "cpu": cpu_metrics,
             "memory": memory_metrics,
             "disk": disk_metrics,
             "network": network_metrics,
-            "boot_time": psutil.boot_time(),
+            "boot_time": _cached_boot_time(),
             "temperature": temperature_metrics,
         }
+        _METRICS_CACHE.update(ts=now, value=copy.deepcopy(metrics))
+        return metrics
     except Exception as e:
         return {
             "cpu": {
                 "percent": psutil.cpu_percent(interval=1),
-                "cores": psutil.cpu_count(),
+                "cores": _cached_cpu_count(),
             },
             "memory": {
                 "total": psutil.virtual_memory().total,
@@ -175,7 +225,7 @@ def get_device_info() -> dict[str, str]:
     hostname = platform.node().lower()
 
     # Extract series and number from hostname (e.g., 'mac0001', 'labatt0002')
-    series_match = re.match(r"^([a-z]+)(\d+)$", hostname)
+    series_match = _SERIES_NUMBER_RE.match(hostname)
     series = series_match.group(1).upper() if series_match else "UNKNOWN"
 
     # Check if the system has a display
@@ -200,51 +250,68 @@ def get_device_info() -> dict[str, str]:
     }
 
 
+@lru_cache(maxsize=1)
+def _get_os_version_info() -> dict:
+    """Get macOS release details, which only change across a reboot.
+
+    Cached for the life of the process. Call
+    ``_get_os_version_info.cache_clear()`` to re-read them. The hostname is
+    not included since a device can be renamed while running.
+    """
+    # Get system info using platform module
+    system_info = {
+        "os": platform.system(),
+        "platform": "macOS",  # Explicitly set platform for clarity
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+    # Get macOS version using platform.mac_ver() - more reliable than parsing sw_vers
+    mac_ver = platform.mac_ver()
+    if mac_ver and mac_ver[0]:
+        system_info["macos_version"] = mac_ver[
+            0
+        ]  # Release version (e.g., "13.4.1")
+        if mac_ver[2]:
+            system_info["machine_type"] = mac_ver[
+                2
+            ]  # Machine type (e.g., "x86_64" or "arm64")
+
+    # Get additional version details using sw_vers for completeness. A bare
+    # sw_vers prints every field as "Key:<tab>value", so one spawn covers all three
+    try:
+        fields = (line.partition(":") for line in run_command(["sw_vers"]).splitlines())
+        sw_vers = {key.strip(): value.strip() for key, sep, value in fields if sep}
+        product_name = sw_vers.get("ProductName", "")
+        product_version = sw_vers.get("ProductVersion", "")
+        build_version = sw_vers.get("BuildVersion", "")
+
+        if product_name:
+            system_info["product_name"] = product_name  # Usually "macOS"
+        if product_version:
+            system_info["macos_version"] = (
+                product_version  # Ensure we have this even if mac_ver failed
+            )
+        if build_version:
+            system_info["build_version"] = (
+                build_version  # Build number (e.g., "22F82")
+            )
+    except Exception as e:
+        system_info["sw_vers_error"] = str(e)
+
+    return system_info
+
+
 def get_version_info() -> dict:
     """Get system and tracker version information."""
     try:
-        # Get system info using platform module
-        system_info = {
-            "os": platform.system(),
-            "platform": "macOS",  # Explicitly set platform for clarity
-            "machine": platform.machine(),
-            "processor": platform.processor(),
-            "hostname": platform.node(),
-        }
-
-        # Get macOS version using platform.mac_ver() - more reliable than parsing sw_vers
-        mac_ver = platform.mac_ver()
-        if mac_ver and mac_ver[0]:
-            system_info["macos_version"] = mac_ver[
-                0
-            ]  # Release version (e.g., "13.4.1")
-            if mac_ver[2]:
-                system_info["machine_type"] = mac_ver[
-                    2
-                ]  # Machine type (e.g., "x86_64" or "arm64")
-
-        # Get additional version details using sw_vers for completeness
-        try:
-            product_name = run_command(["sw_vers", "-productName"]).strip()
-            product_version = run_command(["sw_vers", "-productVersion"]).strip()
-            build_version = run_command(["sw_vers", "-buildVersion"]).strip()
-
-            if product_name:
-                system_info["product_name"] = product_name  # Usually "macOS"
-            if product_version:
-                system_info["macos_version"] = (
-                    product_version  # Ensure we have this even if mac_ver failed
-                )
-            if build_version:
-                system_info["build_version"] = (
-                    build_version  # Build number (e.g., "22F82")
-                )
-        except Exception as e:
-            system_info["sw_vers_error"] = str(e)
+        # Copy so per-call fields below never leak into the cached dict
+        system_info = dict(_get_os_version_info())
+        system_info["hostname"] = platform.node()
 
         # Calculate uptime from boot_time
         try:
-            boot_timestamp = psutil.boot_time()
+            boot_timestamp = _cached_boot_time()
             current_timestamp = datetime.now(UTC).timestamp()
             uptime_seconds = int(current_timestamp - boot_timestamp)
 
@@ -265,7 +332,7 @@ def get_version_info() -> dict:
 
         # Extract series from hostname (e.g., mac0001 -> MAC)
         hostname = system_info["hostname"].lower()
-        series_match = re.match(r"^([a-zA-Z]+)", hostname)
+        series_match = _SERIES_PREFIX_RE.match(hostname)
         if series_match:
             system_info["series"] = series_match.group(
                 1
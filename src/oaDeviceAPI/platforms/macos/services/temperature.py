@@ -127,6 +127,16 @@ def get_temperature_metrics() -> dict:
         # Get all available temperatures
         all_temps = get_all_temperatures()
 
+        # Both thermal state fields parse the same pmset report; read it once
+        try:
+            therm_output = run_command(["pmset", "-g", "therm"])
+            thermal_state = {
+                "pressure": get_thermal_pressure(therm_output),
+                "speed_limit": get_speed_limit_status(therm_output)
+            }
+        except Exception:
+            thermal_state = {"pressure": "unknown", "speed_limit": "unknown"}
+
         # Calculate statistics if we have temperature data
         temp_values = list(all_temps.values()) if all_temps else []
 
@@ -144,10 +154,7 @@ def get_temperature_metrics() -> dict:
                 "max": max(temp_values) if temp_values else None,
                 "hot_count": len([t for t in temp_values if t > 70]) if temp_values else 0
             },
-            "thermal_state": {
-                "pressure": get_thermal_pressure(),
-                "speed_limit": get_speed_limit_status()
-            },
+            "thermal_state": thermal_state,
             "timestamp": datetime.now().isoformat()
         }
 
@@ -162,11 +169,12 @@ def get_temperature_metrics() -> dict:
         }
 
 
-def get_thermal_pressure() -> str:
-    """Get thermal pressure state from macOS."""
+def get_thermal_pressure(output: str | None = None) -> str:
+    """Get thermal pressure state from macOS, reusing ``pmset -g therm`` output if given."""
     try:
         # Try to get thermal pressure info using pmset
-        output = run_command(["pmset", "-g", "therm"])
+        if output is None:
+            output = run_command(["pmset", "-g", "therm"])
         if "thermal pressure" in output.lower():
             if "nominal" in output.lower():
                 return "nominal"
@@ -181,11 +189,12 @@ def get_thermal_pressure() -> str:
         return "unknown"
 
 
-def get_speed_limit_status() -> str:
-    """Get CPU speed limit status."""
+def get_speed_limit_status(output: str | None = None) -> str:
+    """Get CPU speed limit status, reusing ``pmset -g therm`` output if given."""
     try:
         # Check if CPU is being throttled
-        output = run_command(["pmset", "-g", "therm"])
+        if output is None:
+            output = run_command(["pmset", "-g", "therm"])
         if "speed limit" in output.lower():
             if "100%" in output:
                 return "normal"
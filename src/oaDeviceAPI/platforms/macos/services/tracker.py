@@ -30,18 +30,23 @@ def check_tracker_status() -> dict[str, str]:
         tracker_start_time = None
         if tracker_running:
             try:
+                # process_iter() reads the requested attrs in one oneshot()
+                # pass per process; use proc.info instead of re-querying
                 for proc in psutil.process_iter(
-                    ["pid", "cpu_percent", "memory_percent", "create_time"]
+                    ["pid", "name", "cpu_percent", "memory_percent", "create_time"]
                 ):
-                    if "oaTracker" in proc.name():
-                        create_time = datetime.fromtimestamp(
-                            proc.create_time(), UTC
-                        )
-                        tracker_start_time = create_time.isoformat()
+                    info = proc.info
+                    if "oaTracker" in (info["name"] or ""):
+                        # Attrs the process denied access to come back as None
+                        if info["create_time"] is not None:
+                            create_time = datetime.fromtimestamp(
+                                info["create_time"], UTC
+                            )
+                            tracker_start_time = create_time.isoformat()
                         process_info = {
-                            "pid": proc.pid,
-                            "cpu_usage": proc.cpu_percent(),
-                            "memory_usage": proc.memory_percent(),
+                            "pid": info["pid"],
+                            "cpu_usage": info["cpu_percent"],
+                            "memory_usage": info["memory_percent"],
                             "start_time": tracker_start_time,
                         }
                         break
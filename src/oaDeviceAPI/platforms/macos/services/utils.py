@@ -5,9 +5,56 @@ This module now imports shared utilities from core.utils and provides
 macOS-specific utility functions only.
 """
 
+import ctypes
+from functools import lru_cache
+
 from oaDeviceAPI.core.utils import run_command
 
 
+@lru_cache(maxsize=1)
+def _libc() -> ctypes.CDLL | None:
+    """Load the macOS C library once; None on other systems."""
+    try:
+        libc = ctypes.CDLL("libc.dylib", use_errno=True)
+    except OSError:
+        return None
+    # Declare the prototype so size_t arguments are not truncated to int
+    libc.sysctlbyname.argtypes = [
+        ctypes.c_char_p,
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_size_t),
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+    ]
+    libc.sysctlbyname.restype = ctypes.c_int
+    return libc
+
+
+def sysctl_str(name: str) -> str:
+    """
+    Read a string sysctl value.
+
+    Calls sysctlbyname(3) in-process when libc is available and falls back to
+    spawning ``sysctl -n`` otherwise.
+
+    Args:
+        name: sysctl key (e.g., 'machdep.cpu.brand_string')
+
+    Returns:
+        The value, or empty string on error
+    """
+    libc = _libc()
+    if libc is not None:
+        key = name.encode()
+        size = ctypes.c_size_t(0)
+        # First call sizes the buffer, second one fills it
+        if libc.sysctlbyname(key, None, ctypes.byref(size), None, 0) == 0 and size.value:
+            buf = ctypes.create_string_buffer(size.value)
+            if libc.sysctlbyname(key, buf, ctypes.byref(size), None, 0) == 0:
+                return buf.value.decode(errors="replace").strip()
+    return run_command(["sysctl", "-n", name])
+
+
 def get_system_profiler_info(data_type: str) -> dict:
     """
     Get system information using system_profiler command.
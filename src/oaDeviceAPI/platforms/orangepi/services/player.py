@@ -34,14 +34,19 @@ def check_player_status() -> dict[str, str]:
         player_start_time = None
         if chromium_running:
             try:
-                for proc in psutil.process_iter(["pid", "cpu_percent", "memory_percent", "create_time"]):
-                    if "chromium-browser" in proc.name():
-                        create_time = datetime.fromtimestamp(proc.create_time(), UTC)
-                        player_start_time = create_time.isoformat()
+                # process_iter() reads the requested attrs in one oneshot()
+                # pass per process; use proc.info instead of re-querying
+                for proc in psutil.process_iter(["pid", "name", "cpu_percent", "memory_percent", "create_time"]):
+                    info = proc.info
+                    if "chromium-browser" in (info["name"] or ""):
+                        # Attrs the process denied access to come back as None
+                        if info["create_time"] is not None:
+                            create_time = datetime.fromtimestamp(info["create_time"], UTC)
+                            player_start_time = create_time.isoformat()
                         process_info = {
-                            "pid": proc.pid,
-                            "cpu_usage": proc.cpu_percent(),
-                            "memory_usage": proc.memory_percent(),
+                            "pid": info["pid"],
+                            "cpu_usage": info["cpu_percent"],
+                            "memory_usage": info["memory_percent"],
                             "start_time": player_start_time
                         }
                         break
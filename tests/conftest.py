@@ -1,7 +1,10 @@
 """Pytest configuration and fixtures for oaDeviceAPI tests."""
 
+import subprocess
 import sys
+from contextlib import contextmanager
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -14,25 +17,138 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 @pytest.fixture
 def mock_macos_platform():
     """Mock macOS platform detection."""
+    from src.oaDeviceAPI.core.platform import PlatformManager
+
     with patch("src.oaDeviceAPI.core.config.detect_platform", return_value="macos"), \
          patch("src.oaDeviceAPI.core.config.DETECTED_PLATFORM", "macos"):
+        PlatformManager._reset_cache()
         yield
+    PlatformManager._reset_cache()
 
 
 @pytest.fixture
 def mock_orangepi_platform():
     """Mock OrangePi platform detection."""
+    from src.oaDeviceAPI.core.platform import PlatformManager
+
     with patch("src.oaDeviceAPI.core.config.detect_platform", return_value="orangepi"), \
          patch("src.oaDeviceAPI.core.config.DETECTED_PLATFORM", "orangepi"):
+        PlatformManager._reset_cache()
         yield
+    PlatformManager._reset_cache()
 
 
 @pytest.fixture
 def mock_generic_platform():
     """Mock generic Linux platform detection."""
+    from src.oaDeviceAPI.core.platform import PlatformManager
+
     with patch("src.oaDeviceAPI.core.config.detect_platform", return_value="linux"), \
          patch("src.oaDeviceAPI.core.config.DETECTED_PLATFORM", "linux"):
+        PlatformManager._reset_cache()
         yield
+    PlatformManager._reset_cache()
+
+
+def _platform_manager_for(platform_name):
+    """Build a PlatformManager as if running on the given platform."""
+    from src.oaDeviceAPI.core.platform import PlatformManager
+
+    PlatformManager._reset_cache()
+    try:
+        with patch("src.oaDeviceAPI.core.config.DETECTED_PLATFORM", platform_name):
+            return PlatformManager()
+    finally:
+        PlatformManager._reset_cache()
+
+
+@pytest.fixture(scope="session")
+def macos_manager():
+    """Shared macOS PlatformManager for read-only assertions."""
+    return _platform_manager_for("macos")
+
+
+@pytest.fixture(scope="session")
+def orangepi_manager():
+    """Shared OrangePi PlatformManager for read-only assertions."""
+    return _platform_manager_for("orangepi")
+
+
+@pytest.fixture(scope="session")
+def linux_manager():
+    """Shared generic Linux PlatformManager for read-only assertions."""
+    return _platform_manager_for("linux")
+
+
+@pytest.fixture
+def no_subprocess(monkeypatch, request):
+    """Fail tests that would spawn a real process, unless marked allow_subprocess."""
+    if request.node.get_closest_marker("allow_subprocess"):
+        return
+
+    def _blocked(*args, **kwargs):
+        raise RuntimeError(f"unmocked subprocess call: {args[0] if args else kwargs}")
+
+    monkeypatch.setattr(subprocess, "run", _blocked)
+    monkeypatch.setattr(subprocess, "getoutput", _blocked)
+
+
+def completed(stdout="", returncode=0, stderr=""):
+    """Build the subprocess.CompletedProcess a faked command should return."""
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr=stderr)
+
+
+class FakeRun:
+    """Stand-in for subprocess.run that answers calls with canned results.
+
+    ``results`` is consumed one entry per call; once it is empty every call
+    gets the sticky ``result``. Either may be a CompletedProcess or an
+    exception to raise.
+    """
+
+    def __init__(self):
+        self.result = completed()
+        self.results = []
+        self.calls = []
+
+    def __call__(self, cmd, **kwargs):
+        self.calls.append((cmd, kwargs))
+        result = self.results.pop(0) if self.results else self.result
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    @property
+    def commands(self):
+        """The argv of every call so far, without the keyword arguments."""
+        return [cmd for cmd, _ in self.calls]
+
+
+@pytest.fixture
+def fake_runner():
+    """Fresh FakeRun to pass wherever a runner is injected, e.g. PlatformManager."""
+    return FakeRun()
+
+
+@pytest.fixture
+def fake_run(monkeypatch, fake_runner):
+    """Install a FakeRun as subprocess.run and return it for the test to configure."""
+    monkeypatch.setattr(subprocess, "run", fake_runner)
+    return fake_runner
+
+
+@pytest.fixture
+def make_platform_manager(monkeypatch):
+    """Factory building a fresh PlatformManager for a given platform."""
+    from src.oaDeviceAPI.core.platform import PlatformManager
+
+    def _make(platform_name, **kwargs):
+        monkeypatch.setattr("src.oaDeviceAPI.core.config.DETECTED_PLATFORM", platform_name)
+        PlatformManager._reset_cache()
+        return PlatformManager(**kwargs)
+
+    yield _make
+    PlatformManager._reset_cache()
 
 
 @pytest.fixture
@@ -116,31 +232,49 @@ def mock_external_services():
         yield mock_get
 
 
+def _is_app_module(name):
+    """Whether a module belongs to the application under test."""
+    return name.startswith("main") or name.startswith("src.oaDeviceAPI")
+
+
+@contextmanager
+def _fresh_app_modules():
+    """Re-import the application for one test, then restore the original modules.
+
+    Test modules bind functions from the application at import time; putting the
+    original modules (and their parent-package attributes) back keeps those
+    references consistent with sys.modules for the tests that follow.
+    """
+    saved = {name: module for name, module in sys.modules.items() if _is_app_module(name)}
+    for name in saved:
+        del sys.modules[name]
+    try:
+        yield
+    finally:
+        for name in [name for name in sys.modules if _is_app_module(name)]:
+            del sys.modules[name]
+        sys.modules.update(saved)
+        for name in sorted(saved):
+            parent, _, child = name.rpartition(".")
+            if parent in sys.modules:
+                setattr(sys.modules[parent], child, saved[name])
+
+
 @pytest.fixture
 def test_client_macos(mock_macos_platform, mock_psutil, mock_service_checks, mock_system_commands):
     """Test client with mocked macOS platform."""
-    # Clear module cache to ensure fresh imports with mocked platform
-    modules_to_clear = [m for m in sys.modules.keys() if m.startswith("main") or m.startswith("src.oaDeviceAPI")]
-    for module in modules_to_clear:
-        if module in sys.modules:
-            del sys.modules[module]
-
-    # Import after mocking to ensure platform detection works
-    from main import app
-    return TestClient(app)
+    # Fresh imports so platform detection runs under the mocked platform
+    with _fresh_app_modules():
+        from main import app
+        yield TestClient(app)
 
 
 @pytest.fixture
 def test_client_orangepi(mock_orangepi_platform, mock_psutil, mock_service_checks, mock_system_commands):
     """Test client with mocked OrangePi platform."""
-    # Clear module cache to ensure fresh imports with mocked platform
-    modules_to_clear = [m for m in sys.modules.keys() if m.startswith("main") or m.startswith("src.oaDeviceAPI")]
-    for module in modules_to_clear:
-        if module in sys.modules:
-            del sys.modules[module]
-
-    from main import app
-    return TestClient(app)
+    with _fresh_app_modules():
+        from main import app
+        yield TestClient(app)
 
 
 @pytest.fixture
@@ -234,6 +368,51 @@ def sample_player_data():
     }
 
 
+def _frozen(value):
+    """Recursively wrap dicts in MappingProxyType and lists in tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _frozen(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_frozen(item) for item in value)
+    return value
+
+
+@pytest.fixture(scope="session")
+def healthy_metrics():
+    """Read-only system metrics comfortably inside every threshold."""
+    return _frozen({"cpu": {"percent": 30.0}, "memory": {"percent": 50.0}, "disk": {"percent": 70.0}})
+
+
+@pytest.fixture(scope="session")
+def critical_metrics():
+    """Read-only system metrics with CPU, memory and disk all near exhaustion."""
+    return _frozen({"cpu": {"percent": 98.0}, "memory": {"percent": 95.0}, "disk": {"percent": 99.0}})
+
+
+@pytest.fixture(scope="session")
+def healthy_player():
+    """Read-only status of a running OrangePi player."""
+    return _frozen({"healthy": True, "service_status": "active", "display_connected": True})
+
+
+@pytest.fixture(scope="session")
+def failed_player():
+    """Read-only status of an OrangePi player whose service has failed."""
+    return _frozen({"healthy": False, "service_status": "failed"})
+
+
+@pytest.fixture(scope="session")
+def connected_display():
+    """Read-only display info with a connected HDMI output."""
+    return _frozen({"connected": True, "displays": [{"name": "HDMI-1", "resolution": "1920x1080"}]})
+
+
+@pytest.fixture(scope="session")
+def disconnected_display():
+    """Read-only display info with no display attached."""
+    return _frozen({"connected": False, "displays": []})
+
+
 @pytest.fixture
 def mock_file_system():
     """Mock file system operations."""
@@ -534,7 +713,17 @@ def generate_test_data():
 def test_isolation():
     """Ensure test isolation by clearing caches and state."""
     # Clear any global state that might affect tests
+    from src.oaDeviceAPI.core import config as core_config
+    from src.oaDeviceAPI.core import metrics as core_metrics
+
+    # The shared CPU sample would otherwise carry one test's psutil fakes
+    # into the next
+    core_metrics._CPU_SAMPLE.update(ts=None, per_core=[])
     yield
+    core_metrics._CPU_SAMPLE.update(ts=None, per_core=[])
+    # Tests that re-detect under a patched platform must not leave that
+    # result memoized for later tests
+    core_config.detect_platform.cache_clear()
 
     # Cleanup after each test
     import gc
@@ -133,6 +133,7 @@ class TestConfigurationScenarios:
         # Import after setting env vars
         from src.oaDeviceAPI.core.config import detect_platform
 
+        detect_platform.cache_clear()
         assert detect_platform() == "orangepi"
 
     def test_platform_detection_scenarios(self):
@@ -147,6 +148,7 @@ class TestConfigurationScenarios:
         for system_name, expected_platform in test_cases:
             with patch("platform.system", return_value=system_name):
                 from src.oaDeviceAPI.core.config import detect_platform
+                detect_platform.cache_clear()
                 detected = detect_platform()
                 # On this system, Linux detection may return "linux" or "orangepi"
                 if system_name == "Linux":
@@ -161,7 +163,7 @@ class TestConfigurationScenarios:
         # PLATFORM_CONFIG is the detected platform's config, not all platforms
         assert "service_manager" in PLATFORM_CONFIG
         assert "bin_paths" in PLATFORM_CONFIG
-        assert isinstance(PLATFORM_CONFIG["bin_paths"], list)
+        assert isinstance(PLATFORM_CONFIG["bin_paths"], tuple)
 
         # Validate feature flags
         feature_flags = [
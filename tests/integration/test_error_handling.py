@@ -256,7 +256,7 @@ class TestNetworkErrorHandling:
     @patch("aiohttp.ClientSession.get")
     async def test_external_service_timeout(self, mock_get, test_client_macos):
         """Test handling of external service timeouts."""
-        mock_get.side_effect = asyncio.TimeoutError("Request timed out")
+        mock_get.side_effect = TimeoutError("Request timed out")
 
         # Test tracker stats (calls external service)
         response = test_client_macos.get("/tracker/stats")
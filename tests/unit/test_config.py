@@ -1,8 +1,11 @@
 """Unit tests for configuration management."""
 
 import os
+from collections.abc import Mapping
 from pathlib import Path
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
+
+import pytest
 
 from src.oaDeviceAPI.core.config import (
     HEALTH_SCORE_THRESHOLDS,
@@ -14,6 +17,14 @@ from src.oaDeviceAPI.core.config import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_platform_cache():
+    """Clear the memoized platform detection so each test probes afresh."""
+    detect_platform.cache_clear()
+    yield
+    detect_platform.cache_clear()
+
+
 class TestSettings:
     """Test legacy Settings class."""
 
@@ -104,19 +115,19 @@ class TestPlatformDetection:
         with patch("platform.system", return_value="Darwin"):
             assert detect_platform() == "macos"
 
-    def test_detect_platform_linux_generic(self):
+    def test_detect_platform_linux_generic(self, fs):
         """Test generic Linux detection."""
-        with patch("platform.system", return_value="Linux"), \
-             patch("builtins.open", side_effect=FileNotFoundError):
+        with patch("platform.system", return_value="Linux"):
             assert detect_platform() == "linux"
 
-    def test_detect_platform_linux_orangepi(self):
+    def test_detect_platform_linux_orangepi(self, fs):
         """Test OrangePi detection on Linux."""
+        # Device-tree model file identifies the board as an OrangePi
+        fs.create_file("/proc/device-tree/model", contents="Orange Pi 5B\x00")
+
         with patch("platform.system", return_value="Linux"):
-            # Mock the device-tree model file to contain OrangePi
-            with patch("builtins.open", mock_open(read_data="Orange Pi 5B\x00")):
-                result = detect_platform()
-                assert result == "orangepi"
+            result = detect_platform()
+            assert result == "orangepi"
 
     def test_detect_platform_unknown(self):
         """Test unknown platform detection."""
@@ -167,6 +178,14 @@ class TestPlatformConfig:
         # Should fall back to linux config
         assert config["service_manager"] == "systemctl"
 
+    def test_get_platform_config_is_shared_and_read_only(self):
+        """Test platform configs are built once and cannot be mutated."""
+        config = get_platform_config("macos")
+
+        assert get_platform_config("macos") is config
+        with pytest.raises(TypeError):
+            config["service_manager"] = "custom"
+
     def test_platform_config_defaults(self):
         """Test platform config with None parameter uses detected platform."""
         # This should use detected platform
@@ -184,7 +203,7 @@ class TestConfigurationConstants:
     def test_platform_config_global(self):
         """Test global PLATFORM_CONFIG is set."""
         assert PLATFORM_CONFIG is not None
-        assert isinstance(PLATFORM_CONFIG, dict)
+        assert isinstance(PLATFORM_CONFIG, Mapping)
 
         # Should have essential keys
         essential_keys = ["service_manager", "bin_paths", "temp_dir"]
@@ -306,31 +325,26 @@ class TestPlatformDetectionLogic:
             result = detect_platform()
             assert result == "macos"
 
-    def test_platform_detection_orangepi_device_tree(self):
+    def test_platform_detection_orangepi_device_tree(self, fs):
         """Test OrangePi detection via device tree."""
-        with patch("platform.system", return_value="Linux"), \
-             patch("builtins.open", mock_open(read_data="Orange Pi 5B\x00")):
+        fs.create_file("/proc/device-tree/model", contents="Orange Pi 5B\x00")
+
+        with patch("platform.system", return_value="Linux"):
             result = detect_platform()
             assert result == "orangepi"
 
-    def test_platform_detection_ubuntu_fallback(self):
+    def test_platform_detection_ubuntu_fallback(self, fs):
         """Test Ubuntu detection as OrangePi fallback."""
-        with patch("platform.system", return_value="Linux"), \
-             patch("builtins.open", side_effect=[
-                 FileNotFoundError(),  # device-tree read fails
-                 mock_open(read_data="NAME=Ubuntu\nVERSION=22.04").return_value  # os-release read succeeds
-             ]), \
-             patch("os.path.exists", return_value=True):
+        # No device-tree model file, only an Ubuntu os-release
+        fs.create_file("/etc/os-release", contents='NAME="Ubuntu"\nVERSION=22.04\nID=ubuntu')
 
+        with patch("platform.system", return_value="Linux"):
             result = detect_platform()
             assert result == "orangepi"
 
-    def test_platform_detection_generic_linux(self):
+    def test_platform_detection_generic_linux(self, fs):
         """Test generic Linux detection when OrangePi detection fails."""
-        with patch("platform.system", return_value="Linux"), \
-             patch("builtins.open", side_effect=FileNotFoundError()), \
-             patch("os.path.exists", return_value=False):
-
+        with patch("platform.system", return_value="Linux"):
             result = detect_platform()
             assert result == "linux"
 
@@ -371,7 +385,7 @@ class TestConfigurationIntegration:
             # Should have essential configuration
             assert "service_manager" in config
             assert "bin_paths" in config
-            assert isinstance(config["bin_paths"], list)
+            assert isinstance(config["bin_paths"], tuple)
 
 
 class TestEnvironmentConfiguration:
@@ -1,45 +1,81 @@
 """Unit tests for platform detection logic."""
 
-from unittest.mock import mock_open, patch
+import platform
+import subprocess
+from unittest.mock import patch
+
+import pytest
 
 from src.oaDeviceAPI.core.config import detect_platform, get_platform_config
-from src.oaDeviceAPI.core.platform import PlatformManager
+from src.oaDeviceAPI.core.platform import PlatformManager, get_platform_manager
+from tests.conftest import completed
+
+pytestmark = pytest.mark.usefixtures("no_subprocess")
+
+
+@pytest.fixture(autouse=True)
+def _reset_platform_cache():
+    """Clear memoized detection and manager so each test probes afresh."""
+    detect_platform.cache_clear()
+    get_platform_manager.cache_clear()
+    PlatformManager._reset_cache()
+    yield
+    detect_platform.cache_clear()
+    get_platform_manager.cache_clear()
+    PlatformManager._reset_cache()
+
+
+@pytest.fixture
+def as_platform(monkeypatch):
+    """Force the detected platform seen by config and PlatformManager."""
+    def _set(platform_name):
+        monkeypatch.setattr("src.oaDeviceAPI.core.config.DETECTED_PLATFORM", platform_name)
+        PlatformManager._reset_cache()
+    return _set
 
 
 class TestPlatformDetection:
     """Test platform detection functionality."""
 
-    def test_detect_macos_platform(self):
-        """Test macOS platform detection."""
-        with patch("platform.system", return_value="Darwin"):
-            assert detect_platform() == "macos"
-
-    def test_detect_orangepi_platform(self):
-        """Test OrangePi platform detection via device tree."""
-        with patch("platform.system", return_value="Linux"), \
-             patch("builtins.open", mock_open(read_data="Orange Pi 5B")):
-            assert detect_platform() == "orangepi"
-
-    def test_detect_orangepi_via_os_release(self):
-        """Test OrangePi platform detection via os-release."""
-        with patch("platform.system", return_value="Linux"), \
-             patch("os.path.exists", return_value=True), \
-             patch("builtins.open", side_effect=[
-                 FileNotFoundError,  # No device-tree/model
-                 mock_open(read_data="ID=ubuntu\nNAME=Ubuntu")()
-             ]):
-            assert detect_platform() == "orangepi"
-
-    def test_detect_generic_linux(self):
-        """Test generic Linux platform detection."""
-        with patch("platform.system", return_value="Linux"), \
-             patch("builtins.open", side_effect=FileNotFoundError):
-            assert detect_platform() == "linux"
-
-    def test_detect_unknown_platform(self):
-        """Test unknown platform detection."""
-        with patch("platform.system", return_value="Windows"):
-            assert detect_platform() == "unknown"
+    @pytest.mark.parametrize(
+        ("system", "files", "expected"),
+        [
+            pytest.param("Darwin", {}, "macos", id="macos"),
+            pytest.param(
+                "Linux",
+                {"/proc/device-tree/model": "Orange Pi 5B"},
+                "orangepi",
+                id="orangepi-device-tree",
+            ),
+            pytest.param(
+                "Linux",
+                {"/etc/os-release": "ID=ubuntu\nNAME=Ubuntu"},
+                "orangepi",
+                id="orangepi-os-release",
+            ),
+            pytest.param(
+                "Linux",
+                {"/etc/os-release": 'ID=armbian\nID_LIKE="debian"'},
+                "orangepi",
+                id="orangepi-os-release-like",
+            ),
+            pytest.param(
+                "Linux",
+                {"/etc/os-release": 'ID=fedora\nPRETTY_NAME="Not Debian"'},
+                "linux",
+                id="generic-linux-os-release",
+            ),
+            pytest.param("Linux", {}, "linux", id="generic-linux"),
+            pytest.param("Windows", {}, "unknown", id="unknown"),
+        ],
+    )
+    def test_detect(self, fs, monkeypatch, system, files, expected):
+        """Test platform detection across system and probe-file combinations."""
+        monkeypatch.setattr(platform, "system", lambda: system)
+        for path, contents in files.items():
+            fs.create_file(path, contents=contents)
+
+        assert detect_platform() == expected
 
     def test_platform_override(self):
         """Test manual platform override."""
@@ -49,6 +85,14 @@ class TestPlatformDetection:
                 # Would normally detect Linux, but override forces macOS
                 assert detect_platform() == "macos"
 
+    def test_detect_platform_is_cached(self):
+        """Test repeated detection only probes the system once."""
+        with patch("platform.system", return_value="Darwin") as mock_system:
+            for _ in range(5):
+                assert detect_platform() == "macos"
+
+            assert mock_system.call_count == 1
+
 
 class TestPlatformConfig:
     """Test platform configuration."""
@@ -61,46 +105,48 @@ class TestPlatformConfig:
         assert "bin_paths" in config
         assert "temp_dir" in config
 
-    def test_platform_specific_features(self):
+    @pytest.mark.parametrize(
+        ("platform_name", "camera", "tracker", "screenshot"),
+        [
+            ("macos", True, True, False),
+            ("orangepi", False, False, True),
+        ],
+    )
+    def test_platform_specific_features(
+        self, as_platform, platform_name, camera, tracker, screenshot
+    ):
         """Test platform-specific feature flags."""
-        with patch("src.oaDeviceAPI.core.config.DETECTED_PLATFORM", "macos"):
-            config = get_platform_config()
-            assert config["camera_supported"] == True
-            assert config["tracker_supported"] == True
-            assert config["screenshot_supported"] == False
-
-        with patch("src.oaDeviceAPI.core.config.DETECTED_PLATFORM", "orangepi"):
-            config = get_platform_config()
-            assert config["camera_supported"] == False
-            assert config["tracker_supported"] == False
-            assert config["screenshot_supported"] == True
+        as_platform(platform_name)
+        config = get_platform_config()
+        assert config["camera_supported"] is camera
+        assert config["tracker_supported"] is tracker
+        assert config["screenshot_supported"] is screenshot
 
 
 class TestPlatformManager:
     """Test PlatformManager functionality."""
 
-    def test_platform_manager_macos(self):
-        """Test PlatformManager with macOS."""
-        with patch("src.oaDeviceAPI.core.config.DETECTED_PLATFORM", "macos"):
-            manager = PlatformManager()
-            assert manager.is_macos() == True
-            assert manager.is_orangepi() == False
-            assert manager.supports_feature("camera") == True
-            assert manager.get_service_manager() == "launchctl"
-
-    def test_platform_manager_orangepi(self):
-        """Test PlatformManager with OrangePi."""
-        with patch("src.oaDeviceAPI.core.config.DETECTED_PLATFORM", "orangepi"), \
-             patch("src.oaDeviceAPI.core.platform.DETECTED_PLATFORM", "orangepi"):
-            manager = PlatformManager()
-            assert manager.is_macos() == False
-            assert manager.is_orangepi() == True
-            assert manager.supports_feature("screenshot") == True
-            assert manager.get_service_manager() == "systemctl"
+    @pytest.mark.parametrize(
+        ("platform_name", "is_macos", "feature", "service_manager"),
+        [
+            ("macos", True, "camera", "launchctl"),
+            ("orangepi", False, "screenshot", "systemctl"),
+        ],
+    )
+    def test_platform_manager(
+        self, as_platform, platform_name, is_macos, feature, service_manager
+    ):
+        """Test PlatformManager predicates for each supported platform."""
+        as_platform(platform_name)
+        manager = get_platform_manager()
+        assert manager.is_macos() is is_macos
+        assert manager.is_orangepi() is not is_macos
+        assert manager.supports_feature(feature) is True
+        assert manager.get_service_manager() == service_manager
 
     def test_get_platform_info(self):
         """Test getting comprehensive platform information."""
-        manager = PlatformManager()
+        manager = get_platform_manager()
         info = manager.get_platform_info()
 
         required_keys = ["platform", "service_manager", "bin_paths", "temp_dir", "features", "config"]
@@ -112,26 +158,21 @@ class TestPlatformManager:
         assert "tracker" in info["features"]
         assert "camguard" in info["features"]
 
-    def test_service_status_check_macos(self):
-        """Test service status check on macOS."""
-        with patch("src.oaDeviceAPI.core.config.DETECTED_PLATFORM", "macos"), \
-             patch("subprocess.run") as mock_run, \
-             patch("subprocess.getoutput", return_value="501"):
-
-            mock_run.return_value.stdout = "state = running"
-            manager = PlatformManager()
-
-            assert manager.check_service_status("com.test.service") == True
-
-    def test_service_status_check_linux(self):
-        """Test service status check on Linux."""
-        with patch("src.oaDeviceAPI.core.config.DETECTED_PLATFORM", "orangepi"), \
-             patch("src.oaDeviceAPI.core.platform.DETECTED_PLATFORM", "orangepi"), \
-             patch("subprocess.run") as mock_run:
-
-            mock_result = type('MockResult', (), {})()
-            mock_result.stdout = "active"
-            mock_run.return_value = mock_result
-            manager = PlatformManager()
-
-            assert manager.check_service_status("test.service") == True
+    @pytest.mark.parametrize(
+        ("platform_name", "stdout", "service_name"),
+        [
+            ("macos", "state = running", "com.test.service"),
+            ("orangepi", "active", "test.service"),
+        ],
+    )
+    def test_service_status_check(
+        self, as_platform, monkeypatch, fake_run, platform_name, stdout, service_name
+    ):
+        """Test service status check against launchctl and systemctl output."""
+        as_platform(platform_name)
+        fake_run.result = completed(stdout)
+        monkeypatch.setattr(subprocess, "getoutput", lambda *args: "501")
+
+        manager = get_platform_manager()
+
+        assert manager.check_service_status(service_name) is True
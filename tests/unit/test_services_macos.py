@@ -1,76 +1,343 @@
 """Unit tests for macOS-specific services."""
 
 import json
+import os
+import platform
+import statistics
 import subprocess
-from unittest.mock import AsyncMock, Mock, patch
-
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import aiohttp
+import httpx
+import psutil
 import pytest
-
+from fastapi import HTTPException
+from pydantic import BaseModel, ConfigDict
+
+from src.oaDeviceAPI.models.schemas import CameraInfo
+from src.oaDeviceAPI.platforms.macos.routers import health as health_router
+from src.oaDeviceAPI.platforms.macos.routers.tracker import get_tracker_stats
+from src.oaDeviceAPI.platforms.macos.services import (
+    security,
+    system,
+    temperature,
+    tracker,
+    utils,
+)
 from src.oaDeviceAPI.platforms.macos.services.camera import (
     check_camera_availability,
     get_camera_list,
 )
+from src.oaDeviceAPI.platforms.macos.services.display import get_display_info
 from src.oaDeviceAPI.platforms.macos.services.health import (
     calculate_health_score,
 )
+from src.oaDeviceAPI.platforms.macos.services.security import (
+    check_firewall_status,
+    check_sip_status,
+)
 from src.oaDeviceAPI.platforms.macos.services.system import (
     get_device_info,
     get_system_metrics,
     get_version_info,
 )
 from src.oaDeviceAPI.platforms.macos.services.temperature import get_cpu_temperature
+from tests.conftest import completed
+
+pytestmark = pytest.mark.usefixtures("no_subprocess")
+
+# Canned command output shared by the camera and display tests
+MOCK_CAMERA_JSON = json.dumps({
+    "SPCameraDataType": [
+        {
+            "_name": "FaceTime HD Camera",
+            "model_id": "UVC Camera VendorID_1452 ProductID_34567",
+            "manufacturer": "Apple Inc."
+        }
+    ]
+})
+EMPTY_CAMERA_JSON = json.dumps({"SPCameraDataType": []})
+
+DISPLAY_OUTPUT = '''Graphics/Displays:
+
+    Intel Iris Plus Graphics 655:
+
+      Chipset Model: Intel Iris Plus Graphics 655
+      Type: GPU
+      Bus: Built-In
+      VRAM (Dynamic, Max): 1536 MB
+      Vendor: Intel
+      Device ID: 0x3ea5
+      Revision ID: 0x0001
+      Metal: Supported, feature set macOS GPUFamily2 v1
+
+    Displays:
+
+        Color LCD:
+          Display Type: Built-in Liquid Retina Display  
+          Resolution: 2560 x 1600 Retina
+          UI Looks like: 1280 x 800 @ 227.00 PPI
+          Main Display: Yes
+          Mirror: Off
+          Online: Yes
+          Automatically Adjust Brightness: No
+'''
+
+SW_VERS_OUTPUT = "ProductName:\t\tmacOS\nProductVersion:\t\t14.0\nBuildVersion:\t\t23A344"
+
+PMSET_THERM_OUTPUT = '''Note: No thermal warning level has been recorded
+Note: No performance warning level has been recorded
+CPU Thermal Pressure: Nominal
+CPU_Speed_Limit = 100'''
+
+# psutil results, read-only stand-ins for the named tuples psutil returns
+MEM_STATS = SimpleNamespace(
+    total=8589934592, available=4704452608, percent=45.2,
+    used=3885481984, free=4704452608, cached=0, buffers=0,
+)
+DISK_STATS = SimpleNamespace(
+    total=499963174912, free=160989478400, percent=67.8, used=338973696512,
+)
+NET_IO_STATS = SimpleNamespace(
+    bytes_sent=1024000, bytes_recv=2048000, packets_sent=500, packets_recv=750,
+)
+
+# Service API payloads
+TRACKER_STATS = {
+    "detections": 5,
+    "fps": 15.2,
+    "model_name": "yolo11m.pt",
+    "confidence_threshold": 0.5
+}
+CAMGUARD_STATUS = {
+    "recording": True,
+    "stream_url": "rtsp://localhost:8554/stream",
+    "storage_used": 1024000,
+    "recordings_count": 15
+}
+
+
+class _SystemMetrics(BaseModel):
+    """Schema for a full get_system_metrics() collection."""
+
+    model_config = ConfigDict(extra="allow")
+
+    cpu: dict
+    memory: dict
+    disk: dict
+    network: dict
+    boot_time: float
+    temperature: dict
+
+
+class FakeAsyncClient:
+    """Stand-in for httpx.AsyncClient whose get() returns ``response`` or raises ``error``."""
+
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def get(self, *args, **kwargs):
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+class FakeAiohttpResponse:
+    """Stand-in for the aiohttp response context manager returned by ClientSession.get()."""
+
+    def __init__(self, data, status=200):
+        self._data = data
+        self.status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def json(self):
+        return self._data
+
+
+
+@pytest.fixture(autouse=True)
+def _reset_version_cache():
+    """Drop the cached OS version details and metrics so each test sees its own fakes."""
+    system._get_os_version_info.cache_clear()
+    system._METRICS_CACHE.update(ts=0.0, value=None)
+    system._NET_CONN_CACHE.update(ts=0.0, value=None)
+    system._cached_boot_time.cache_clear()
+    system._cached_cpu_count.cache_clear()
+    yield
+    system._get_os_version_info.cache_clear()
+    system._METRICS_CACHE.update(ts=0.0, value=None)
+    system._NET_CONN_CACHE.update(ts=0.0, value=None)
+    system._cached_boot_time.cache_clear()
+    system._cached_cpu_count.cache_clear()
+
+
+@pytest.fixture
+def fake_psutil(monkeypatch):
+    """Swap the psutil calls used by the metrics services for plain functions.
+
+    The functions read from the returned namespace, so a test can change a
+    value without re-patching. Setting a value to an exception instance makes
+    the matching call raise it.
+    """
+    values = SimpleNamespace(
+        cpu_percent=25.5,
+        cpu_count=8,
+        boot_time=1640995200.0,
+        virtual_memory=MEM_STATS,
+        disk_usage=DISK_STATS,
+        net_io_counters=NET_IO_STATS,
+    )
+
+    def _value(name):
+        value = getattr(values, name)
+        if isinstance(value, BaseException):
+            raise value
+        return value
+
+    def _net_io_counters(pernic=False, **kwargs):
+        return {"en0": _value("net_io_counters")} if pernic else _value("net_io_counters")
+
+    def _cpu_percent(*args, percpu=False, **kwargs):
+        return [_value("cpu_percent")] if percpu else _value("cpu_percent")
+
+    monkeypatch.setattr(psutil, "cpu_percent", _cpu_percent)
+    monkeypatch.setattr(psutil, "cpu_count", lambda *args, **kwargs: _value("cpu_count"))
+    monkeypatch.setattr(psutil, "boot_time", lambda: _value("boot_time"))
+    monkeypatch.setattr(psutil, "virtual_memory", lambda: _value("virtual_memory"))
+    monkeypatch.setattr(psutil, "disk_usage", lambda path: _value("disk_usage"))
+    monkeypatch.setattr(psutil, "net_io_counters", _net_io_counters)
+    return values
+
+
+@pytest.fixture
+def fake_platform(monkeypatch):
+    """Pin the platform module's host identity calls to a Mac.
+
+    Like fake_psutil, the functions read from the returned namespace so a
+    test can change one value, e.g. the hostname.
+    """
+    values = SimpleNamespace(
+        system="Darwin",
+        node="mac0001.local",
+        machine="arm64",
+        processor="arm",
+        mac_ver=("14.0", ("", "", ""), "arm64"),
+    )
+    for name in vars(values):
+        monkeypatch.setattr(platform, name, lambda name=name: getattr(values, name))
+    return values
 
 
 class TestMacOSSystemServices:
     """Test macOS system information services."""
 
-    def test_get_system_metrics_success(self):
+    def test_get_system_metrics_success(self, monkeypatch, fake_psutil):
         """Test successful system metrics retrieval."""
-        with patch("psutil.cpu_percent", return_value=25.5), \
-             patch("psutil.cpu_count", return_value=8), \
-             patch("psutil.virtual_memory") as mock_memory, \
-             patch("psutil.disk_usage") as mock_disk, \
-             patch("psutil.boot_time", return_value=1640995200.0):
-
-            # Configure mocks
-            mock_memory.return_value = Mock(
-                total=8589934592, available=4704452608, percent=45.2,
-                used=3885481984, free=4704452608, cached=0, buffers=0
-            )
-            mock_disk.return_value = Mock(
-                total=499963174912, free=160989478400, percent=67.8, used=338973696512
-            )
+        monkeypatch.setattr(system, "get_temperature_metrics", lambda: {})
+
+        metrics = get_system_metrics()
+
+        _SystemMetrics.model_validate(metrics)
+        assert metrics["cpu"]["percent"] == 25.5
+        assert metrics["cpu"]["cores"] == 8
+        assert metrics["memory"]["percent"] == 45.2
+        assert metrics["disk"]["percent"] == 67.8
+        assert metrics["boot_time"] == 1640995200.0
+
+    def test_get_system_metrics_cached_within_ttl(self, monkeypatch, fake_psutil):
+        """Test that rapid calls reuse one collection until the TTL expires."""
+        calls = []
+        monkeypatch.setattr(system, "get_temperature_metrics", lambda: calls.append(1) or {})
+        clock = [100.0]
+        monkeypatch.setattr(system.time, "monotonic", lambda: clock[0])
+
+        first = get_system_metrics()
+        for _ in range(19):
+            assert get_system_metrics() == first
+        assert len(calls) == 1
+
+        clock[0] += system._METRICS_TTL
+        get_system_metrics()
+        assert len(calls) == 2
+
+    def test_get_system_metrics_cache_returns_copies(self, monkeypatch, fake_psutil):
+        """Test a caller mutating its metrics cannot change what later callers see."""
+        monkeypatch.setattr(system, "get_temperature_metrics", lambda: {})
+
+        first = get_system_metrics()
+        first["cpu"]["percent"] = 99.9
+        first["injected"] = True
+
+        second = get_system_metrics()
+        assert second["cpu"]["percent"] == 25.5
+        assert "injected" not in second
+
+    def test_metrics_cache_dedupes_subprocess(self, fake_run, fake_psutil):
+        """Test a burst of metrics polls spawns commands for one collection only."""
+        fake_run.result = completed("CPU_Speed_Limit = 100")
+
+        get_system_metrics()
+        spawned_by_one_collection = len(fake_run.calls)
+        for _ in range(19):
+            get_system_metrics()
+
+        assert spawned_by_one_collection >= 1  # at least pmset for the thermal state
+        assert len(fake_run.calls) == spawned_by_one_collection
+
+    def test_get_system_metrics_reads_shared_cpu_sample(self, monkeypatch, fake_psutil):
+        """Test metrics reuse the shared CPU sample instead of blocking on a new one."""
+        from src.oaDeviceAPI.core.metrics import sample_cpu_usage
+
+        monkeypatch.setattr(system, "get_temperature_metrics", lambda: {})
+        sampled = []
+        monkeypatch.setattr(
+            psutil, "cpu_percent",
+            lambda interval=None, percpu=False: sampled.append(percpu) or [30.0, 50.0],
+        )
+        sample_cpu_usage(system._METRICS_TTL)
+        assert sampled == [True]  # one per-core sample covers the overall figure too
+        sampled.clear()
 
-            metrics = get_system_metrics()
+        metrics = get_system_metrics()
 
-            assert "cpu" in metrics
-            assert "memory" in metrics
-            assert "disk" in metrics
-            assert "boot_time" in metrics
-            assert metrics["cpu"]["percent"] == 25.5
-            assert metrics["cpu"]["cores"] == 8
-            assert metrics["memory"]["percent"] == 45.2
-            assert metrics["disk"]["percent"] == 67.8
-            assert metrics["boot_time"] == 1640995200.0
-
-    def test_get_system_metrics_failure_recovery(self):
-        """Test system metrics when some components fail."""
-        with patch("psutil.cpu_percent", return_value=25.5), \
-             patch("psutil.cpu_count", return_value=8), \
-             patch("psutil.virtual_memory") as mock_memory, \
-             patch("psutil.disk_usage") as mock_disk, \
-             patch("psutil.boot_time", return_value=1640995200.0), \
-             patch("src.oaDeviceAPI.platforms.macos.services.temperature.get_temperature_metrics", side_effect=Exception("Temp failed")):
-
-            # Configure mocks
-            mock_memory.return_value = Mock(
-                total=8589934592, available=4704452608, percent=45.2,
-                used=3885481984, free=4704452608, cached=0, buffers=0
-            )
-            mock_disk.return_value = Mock(
-                total=499963174912, free=160989478400, percent=67.8, used=338973696512
-            )
+        assert metrics["cpu"]["percent"] == 40.0
+        assert metrics["cpu"]["per_core"] == [30.0, 50.0]
+        assert sampled == []
+
+    def test_net_connections_throttled(self, monkeypatch):
+        """Test the socket scan is reused until OA_NET_CONN_TTL expires."""
+        scans = []
+        monkeypatch.setattr(psutil, "net_connections", lambda *args, **kwargs: scans.append(1) or [object()] * 3)
+        clock = [100.0]
+        monkeypatch.setattr(system.time, "monotonic", lambda: clock[0])
+
+        assert system._throttled_net_connections() == 3
+        clock[0] += system._NET_CONN_TTL - 1
+        assert system._throttled_net_connections() == 3
+        assert len(scans) == 1
+
+        clock[0] += 1
+        system._throttled_net_connections()
+        assert len(scans) == 2
 
+    def test_get_system_metrics_failure_recovery(self, fake_psutil):
+        """Test system metrics when some components fail."""
+        with patch("src.oaDeviceAPI.platforms.macos.services.system.get_temperature_metrics", autospec=True, side_effect=Exception("Temp failed")):
             metrics = get_system_metrics()
 
             # Should handle failures gracefully
@@ -86,21 +353,20 @@ class TestMacOSSystemServices:
 
     def test_get_device_info_success(self):
         """Test successful device info gathering."""
-        with patch("platform.node", return_value="mac0001"), \
-             patch("src.oaDeviceAPI.platforms.macos.services.utils.run_command", return_value="Display output found"):
+        with patch("platform.node", autospec=True, return_value="mac0001"), \
+             patch("src.oaDeviceAPI.platforms.macos.services.system.run_command", autospec=True, return_value="Display output found"):
 
             info = get_device_info()
 
             assert info["type"] == "Mac"
             assert info["series"] == "MAC"  # Should extract "mac" from "mac0001"
             assert info["hostname"] == "mac0001"
-            assert "is_headless" in info
-            assert isinstance(info["is_headless"], bool)
+            assert info["is_headless"] is False  # A display was reported
 
     def test_get_device_info_command_failures(self):
         """Test device info with command failures."""
-        with patch("platform.node", return_value="unknown"), \
-             patch("src.oaDeviceAPI.platforms.macos.services.utils.run_command", side_effect=Exception("Command failed")):
+        with patch("platform.node", autospec=True, return_value="unknown"), \
+             patch("src.oaDeviceAPI.platforms.macos.services.system.run_command", autospec=True, side_effect=Exception("Command failed")):
 
             info = get_device_info()
 
@@ -109,143 +375,144 @@ class TestMacOSSystemServices:
             assert info["series"] == "UNKNOWN"  # Falls back to UNKNOWN when regex fails
             assert info["hostname"] == "unknown"
             assert "is_headless" in info
-            assert info["is_headless"] == True  # Assumes headless on command failure
+            assert info["is_headless"] is True  # Assumes headless on command failure
 
-    def test_get_version_info_success(self):
+    def test_get_version_info_success(self, monkeypatch, fake_psutil, fake_platform):
         """Test successful version info gathering."""
-        with patch("platform.system", return_value="Darwin"), \
-             patch("platform.node", return_value="mac0001.local"), \
-             patch("platform.machine", return_value="arm64"), \
-             patch("platform.processor", return_value="arm"), \
-             patch("platform.mac_ver", return_value=("14.0", ("", "", ""), "arm64")), \
-             patch("psutil.boot_time", return_value=1640995200.0), \
-             patch("src.oaDeviceAPI.platforms.macos.services.utils.run_command", return_value="macOS"):
-
-            info = get_version_info()
-
-            assert info["os"] == "Darwin"
-            assert info["platform"] == "macOS"
-            assert info["machine"] == "arm64"
-            assert info["hostname"] == "mac0001.local"
-            assert "uptime" in info
-            assert info["series"] == "MAC"
-            assert info["device_id"] == "mac0001.local"
-
-    def test_get_version_info_command_failures(self):
+        monkeypatch.setattr(system, "run_command", lambda cmd: "macOS")
+
+        info = get_version_info()
+
+        assert info["os"] == "Darwin"
+        assert info["platform"] == "macOS"
+        assert info["machine"] == "arm64"
+        assert info["hostname"] == "mac0001.local"
+        assert "uptime" in info
+        assert info["series"] == "MAC"
+        assert info["device_id"] == "mac0001.local"
+
+    def test_get_version_info_command_failures(self, monkeypatch, fake_psutil, fake_platform):
         """Test version info with command failures."""
-        with patch("platform.system", return_value="Darwin"), \
-             patch("platform.node", return_value="mac0001"), \
-             patch("platform.machine", return_value="arm64"), \
-             patch("platform.processor", return_value="arm"), \
-             patch("platform.mac_ver", return_value=("14.0", ("", "", ""), "arm64")), \
-             patch("psutil.boot_time", return_value=1640995200.0), \
-             patch("src.oaDeviceAPI.platforms.macos.services.utils.run_command", side_effect=Exception("Command failed")):
-
-            info = get_version_info()
-
-            # Should handle sw_vers command failures gracefully but still have platform data
-            assert info["os"] == "Darwin"
-            assert info["platform"] == "macOS"
-            assert info["machine"] == "arm64"
-            assert info["hostname"] == "mac0001"
-            # The function actually succeeds in getting some sw_vers data despite the exception
-            # so we just check that basic data is present
-            assert "uptime" in info  # psutil.boot_time should still work
-            assert info["series"] == "MAC"  # Should extract from hostname  # Should extract from hostname  # psutil.boot_time should still work
+        fake_platform.node = "mac0001"
 
+        def _failing_run_command(cmd):
+            raise Exception("Command failed")
 
-class TestMacOSTemperatureService:
-    """Test macOS temperature monitoring."""
+        monkeypatch.setattr(system, "run_command", _failing_run_command)
 
-    def test_get_cpu_temperature_success(self):
-        """Test successful CPU temperature reading."""
-        with patch("os.path.exists", return_value=True), \
-             patch("os.access", return_value=True), \
-             patch("src.oaDeviceAPI.platforms.macos.services.temperature.run_command", return_value="+45.2°C"):
+        info = get_version_info()
 
-            temp = get_cpu_temperature()
+        # Should handle sw_vers command failures gracefully but still have platform data
+        assert info["os"] == "Darwin"
+        assert info["platform"] == "macOS"
+        assert info["machine"] == "arm64"
+        assert info["hostname"] == "mac0001"
+        assert info["sw_vers_error"] == "Command failed"
+        assert "uptime" in info  # psutil.boot_time should still work
+        assert info["series"] == "MAC"  # Should extract from hostname
 
-            assert temp == 45.2
-            assert isinstance(temp, float)
-        # Should call powermetrics or similar
+    def test_get_version_info_caches_os_details(self, monkeypatch, fake_psutil, fake_platform):
+        """Test sw_vers and boot time are read once while uptime and hostname are still read per call."""
+        calls = []
+
+        def _run_command(cmd):
+            calls.append(cmd)
+            return SW_VERS_OUTPUT
 
-    def test_get_cpu_temperature_command_failure(self):
-        """Test CPU temperature when command fails."""
-        with patch("os.path.exists", return_value=False), \
-             patch("os.access", return_value=False):
+        monkeypatch.setattr(system, "run_command", _run_command)
 
-            temp = get_cpu_temperature()
+        first = get_version_info()
+        fake_psutil.boot_time = 1640995200.0 - 60
+        fake_platform.node = "labatt0002.local"
+        second = get_version_info()
 
-            # Should return None when smctemp binary is not available
-            assert temp is None
+        assert calls == [["sw_vers"]]  # one spawn covers all three fields
+        # Hostname and the series derived from it are read live
+        assert first["series"] == "MAC"
+        assert second["hostname"] == "labatt0002.local"
+        assert second["series"] == "LABATT"
+        assert first["product_name"] == second["product_name"] == "macOS"
+        assert first["macos_version"] == "14.0"
+        assert first["build_version"] == "23A344"
+        assert second["uptime"]["boot_time"] == first["uptime"]["boot_time"]
+        assert second["uptime"]["seconds"] >= first["uptime"]["seconds"]
+        assert second["uptime"] is not first["uptime"]
+        assert first is not second
 
-    def test_get_cpu_temperature_invalid_output(self):
-        """Test CPU temperature with invalid command output."""
-        with patch("os.path.exists", return_value=True), \
-             patch("os.access", return_value=True), \
-             patch("src.oaDeviceAPI.platforms.macos.services.temperature.run_command", return_value="invalid_temp"):
 
-            temp = get_cpu_temperature()
+class TestMacOSTemperatureService:
+    """Test macOS temperature monitoring."""
+
+    @pytest.mark.parametrize(
+        "binary_present,run_result,expected",
+        [
+            (True, "+45.2°C", 45.2),
+            (False, None, None),  # smctemp binary is not available
+            (True, "invalid_temp", None),  # Temperature parsing fails
+            (True, PermissionError("Permission denied"), None),
+        ],
+        ids=["success", "binary_missing", "invalid_output", "permission_denied"],
+    )
+    def test_get_cpu_temperature(self, monkeypatch, binary_present, run_result, expected):
+        """Test CPU temperature reading across smctemp availability and output."""
+        def _run_command(*args, **kwargs):
+            if isinstance(run_result, BaseException):
+                raise run_result
+            return run_result
+
+        monkeypatch.setattr(os.path, "exists", lambda path: binary_present)
+        monkeypatch.setattr(os, "access", lambda path, mode: binary_present)
+        monkeypatch.setattr(temperature, "run_command", _run_command)
+
+        temp = get_cpu_temperature()
+
+        assert temp == expected
+        if expected is not None:
+            assert isinstance(temp, float)
+
 
-            # Should return None when temperature parsing fails
-            assert temp is None
+    def test_get_temperature_metrics_reads_pmset_once(self, monkeypatch):
+        """Test both thermal state fields are parsed from a single pmset call."""
+        calls = []
 
-    def test_get_cpu_temperature_permission_denied(self):
-        """Test CPU temperature with permission denied."""
-        with patch("os.path.exists", return_value=True), \
-             patch("os.access", return_value=True), \
-             patch("src.oaDeviceAPI.platforms.macos.services.temperature.run_command", side_effect=PermissionError("Permission denied")):
+        def _run_command(cmd):
+            calls.append(cmd)
+            return PMSET_THERM_OUTPUT
 
-            temp = get_cpu_temperature()
+        monkeypatch.setattr(temperature, "get_cpu_temperature", lambda: None)
+        monkeypatch.setattr(temperature, "get_all_temperatures", lambda: {})
+        monkeypatch.setattr(temperature, "run_command", _run_command)
 
-            # Should return None when permission is denied
-            assert temp is None
+        metrics = temperature.get_temperature_metrics()
 
+        assert calls == [["pmset", "-g", "therm"]]
+        assert metrics["thermal_state"]["pressure"] == "nominal"
 
 class TestMacOSCameraService:
     """Test macOS camera services."""
 
     def test_get_camera_list_success(self):
         """Test successful camera information gathering."""
-        mock_camera_data = {
-            "SPCameraDataType": [
-                {
-                    "_name": "FaceTime HD Camera",
-                    "model_id": "UVC Camera VendorID_1452 ProductID_34567",
-                    "manufacturer": "Apple Inc."
-                }
-            ]
-        }
-
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout=json.dumps(mock_camera_data)
-            )
+            mock_run.return_value = completed(MOCK_CAMERA_JSON)
 
             cameras = get_camera_list()
 
             assert len(cameras) == 1
             assert cameras[0].name == "FaceTime HD Camera"
-            assert cameras[0].is_built_in == True  # FaceTime cameras are built-in
-            assert cameras[0].is_connected == True
+            assert cameras[0].is_built_in is True  # FaceTime cameras are built-in
+            assert cameras[0].is_connected is True
             assert cameras[0].location == "Built-in"
 
     def test_get_camera_list_no_cameras(self):
         """Test camera info when no cameras are available."""
-        mock_camera_data = {"SPCameraDataType": []}  # Empty camera list
-
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout=json.dumps(mock_camera_data)
-            )
+            mock_run.return_value = completed(EMPTY_CAMERA_JSON)
 
             cameras = get_camera_list()
 
             # Should return empty list when no cameras found
-            assert len(cameras) == 0
-            assert isinstance(cameras, list)
+            assert cameras == []
 
     def test_get_camera_list_command_failure(self):
         """Test camera info when command fails."""
@@ -254,46 +521,42 @@ class TestMacOSCameraService:
             cameras = get_camera_list()
 
             # Should return empty list when system_profiler command fails
-            assert len(cameras) == 0
-            assert isinstance(cameras, list)
+            assert cameras == []
 
     def test_get_camera_list_invalid_json(self):
         """Test camera info with invalid JSON output."""
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0, stdout="invalid json")
+            mock_run.return_value = completed("invalid json")
 
             cameras = get_camera_list()
 
             # Should return empty list when JSON parsing fails
-            assert len(cameras) == 0
-            assert isinstance(cameras, list)
+            assert cameras == []
 
     def test_check_camera_availability_success(self):
         """Test camera availability checking."""
-        from src.oaDeviceAPI.models.schemas import CameraInfo
-
         mock_cameras = [
             CameraInfo(id="cam1", name="Camera 1", is_connected=True, is_available=True),
         ]
 
-        with patch("src.oaDeviceAPI.platforms.macos.services.camera.get_camera_list", return_value=mock_cameras), \
-             patch("requests.head") as mock_head:
+        with patch("src.oaDeviceAPI.platforms.macos.services.camera.get_camera_list", autospec=True, return_value=mock_cameras), \
+             patch("requests.head", autospec=True) as mock_head:
 
             # Mock successful tracker response
-            mock_head.return_value = Mock(status_code=200)
+            mock_head.return_value = SimpleNamespace(status_code=200)
 
             result = check_camera_availability()
 
             assert result["status"] == "ok"
             assert result["camera_count"] == 1
-            assert result["tracker_available"] == True
+            assert result["tracker_available"] is True
             assert len(result["cameras"]) == 1
             assert "timestamp" in result
 
     def test_check_camera_availability_no_cameras(self):
         """Test camera availability when no cameras exist."""
-        with patch("src.oaDeviceAPI.platforms.macos.services.camera.get_camera_list", return_value=[]), \
-             patch("requests.head") as mock_head:
+        with patch("src.oaDeviceAPI.platforms.macos.services.camera.get_camera_list", autospec=True, return_value=[]), \
+             patch("requests.head", autospec=True) as mock_head:
 
             # Mock failed tracker response
             mock_head.side_effect = Exception("Connection failed")
@@ -302,7 +565,7 @@ class TestMacOSCameraService:
 
             assert result["status"] == "no_cameras"
             assert result["camera_count"] == 0
-            assert result["tracker_available"] == False
+            assert result["tracker_available"] is False
             assert len(result["cameras"]) == 0
             assert "timestamp" in result
 
@@ -311,21 +574,11 @@ class TestMacOSTrackerService:
     """Test macOS tracker service integration."""
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_get_tracker_stats_success(self, mock_client):
+    async def test_get_tracker_stats_success(self, monkeypatch):
         """Test successful tracker stats retrieval."""
-        from src.oaDeviceAPI.platforms.macos.routers.tracker import get_tracker_stats
-
-        # Mock successful response
-        mock_response = AsyncMock()
-        mock_response.json.return_value = {
-            "detections": 5,
-            "fps": 15.2,
-            "model_name": "yolo11m.pt",
-            "confidence_threshold": 0.5
-        }
-
-        mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+        # httpx's Response.json() is synchronous, so hand back a real response
+        client = FakeAsyncClient(response=httpx.Response(200, json=TRACKER_STATS))
+        monkeypatch.setattr(httpx, "AsyncClient", lambda *args, **kwargs: client)
 
         result = await get_tracker_stats()
 
@@ -335,16 +588,10 @@ class TestMacOSTrackerService:
         assert result["confidence_threshold"] == 0.5
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_get_tracker_stats_connection_error(self, mock_client):
+    async def test_get_tracker_stats_connection_error(self, monkeypatch):
         """Test tracker stats connection error handling."""
-        import httpx
-        from fastapi import HTTPException
-
-        from src.oaDeviceAPI.platforms.macos.routers.tracker import get_tracker_stats
-
-        # Mock connection error
-        mock_client.return_value.__aenter__.return_value.get.side_effect = httpx.RequestError("Connection failed")
+        client = FakeAsyncClient(error=httpx.RequestError("Connection failed"))
+        monkeypatch.setattr(httpx, "AsyncClient", lambda *args, **kwargs: client)
 
         with pytest.raises(HTTPException) as exc_info:
             await get_tracker_stats()
@@ -353,15 +600,10 @@ class TestMacOSTrackerService:
         assert "Error connecting to oaTracker API" in str(exc_info.value.detail)
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_get_tracker_stats_invalid_response(self, mock_client):
+    async def test_get_tracker_stats_invalid_response(self, monkeypatch):
         """Test tracker stats invalid response handling."""
-        from fastapi import HTTPException
-
-        from src.oaDeviceAPI.platforms.macos.routers.tracker import get_tracker_stats
-
-        # Mock unexpected error
-        mock_client.return_value.__aenter__.return_value.get.side_effect = Exception("Unexpected error")
+        client = FakeAsyncClient(error=Exception("Unexpected error"))
+        monkeypatch.setattr(httpx, "AsyncClient", lambda *args, **kwargs: client)
 
         with pytest.raises(HTTPException) as exc_info:
             await get_tracker_stats()
@@ -370,21 +612,43 @@ class TestMacOSTrackerService:
         assert "Unexpected error" in str(exc_info.value.detail)
 
 
+    @pytest.mark.parametrize("create_time,start_time", [
+        (1640995200.0, "2022-01-01T00:00:00+00:00"),
+        (None, None),  # create_time denied by AccessDenied
+    ], ids=["readable", "access-denied"])
+    def test_check_tracker_status_reads_prefetched_process_info(self, monkeypatch, create_time, start_time):
+        """Test the process details come from process_iter's attrs, not extra calls."""
+        outputs = {"list": "active", "aux": "user 123 oaTracker"}
+        monkeypatch.setattr(tracker, "run_command", lambda cmd: outputs[cmd[1]])
+        monkeypatch.setattr(tracker, "get_display_info", lambda: {"connected": True})
+        proc = SimpleNamespace(info={
+            "pid": 123,
+            "name": "oaTracker",
+            "cpu_percent": 12.5,
+            "memory_percent": 3.0,
+            "create_time": create_time,
+        })
+        monkeypatch.setattr(psutil, "process_iter", lambda attrs: iter([proc]))
+
+        status = tracker.check_tracker_status()
+
+        assert status["healthy"] is True
+        assert status["process"] == {
+            "pid": 123,
+            "cpu_usage": 12.5,
+            "memory_usage": 3.0,
+            "start_time": start_time,
+        }
+        assert status["tracker_start_time"] == start_time
+
 class TestMacOSCamGuardService:
     """Test macOS CamGuard service integration."""
 
-    @patch("aiohttp.ClientSession.get")
-    async def test_get_camguard_status_success(self, mock_get):
+    async def test_get_camguard_status_success(self, monkeypatch):
         """Test successful CamGuard status retrieval."""
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={
-            "recording": True,
-            "stream_url": "rtsp://localhost:8554/stream",
-            "storage_used": 1024000,
-            "recordings_count": 15
-        })
-        mock_get.return_value.__aenter__.return_value = mock_response
+        monkeypatch.setattr(
+            aiohttp.ClientSession, "get", lambda self, *args, **kwargs: FakeAiohttpResponse(CAMGUARD_STATUS)
+        )
 
         from src.oaDeviceAPI.platforms.macos.services.camguard import (
             get_camguard_status,
@@ -397,10 +661,12 @@ class TestMacOSCamGuardService:
         assert status["healthy"] is True
         assert status["storage_used"] == 1024000
 
-    @patch("aiohttp.ClientSession.get")
-    async def test_get_camguard_status_service_down(self, mock_get):
+    async def test_get_camguard_status_service_down(self, monkeypatch):
         """Test CamGuard status when service is down."""
-        mock_get.side_effect = ConnectionRefusedError("Connection refused")
+        def _refused(self, *args, **kwargs):
+            raise ConnectionRefusedError("Connection refused")
+
+        monkeypatch.setattr(aiohttp.ClientSession, "get", _refused)
 
         from src.oaDeviceAPI.platforms.macos.services.camguard import (
             get_camguard_status,
@@ -416,59 +682,36 @@ class TestMacOSCamGuardService:
 class TestMacOSSecurityService:
     """Test macOS security services."""
 
-    @patch("subprocess.run")
-    def test_check_sip_status_enabled(self, mock_run):
+    def test_check_sip_status_enabled(self, fake_run):
         """Test System Integrity Protection status check when enabled."""
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="System Integrity Protection status: enabled."
-        )
-
-        from src.oaDeviceAPI.platforms.macos.services.security import check_sip_status
+        fake_run.result = completed("System Integrity Protection status: enabled.")
 
         status = check_sip_status()
 
         assert status["enabled"] is True
         assert status["status"] == "enabled"
 
-    @patch("subprocess.run")
-    def test_check_sip_status_disabled(self, mock_run):
+    def test_check_sip_status_disabled(self, fake_run):
         """Test SIP status when disabled."""
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="System Integrity Protection status: disabled."
-        )
-
-        from src.oaDeviceAPI.platforms.macos.services.security import check_sip_status
+        fake_run.result = completed("System Integrity Protection status: disabled.")
 
         status = check_sip_status()
 
         assert status["enabled"] is False
         assert status["status"] == "disabled"
 
-    @patch("subprocess.run")
-    def test_check_firewall_status_success(self, mock_run):
+    def test_check_firewall_status_success(self, fake_run):
         """Test firewall status checking."""
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="Firewall is enabled. (State = 1)"
-        )
-
-        from src.oaDeviceAPI.platforms.macos.services.security import (
-            check_firewall_status,
-        )
+        fake_run.result = completed("Firewall is enabled. (State = 1)")
 
         status = check_firewall_status()
 
         assert status["enabled"] is True
         assert "State = 1" in status["details"]
 
-    @patch("subprocess.run")
-    def test_security_command_not_found(self, mock_run):
+    def test_security_command_not_found(self, fake_run):
         """Test security checks when commands are not found."""
-        mock_run.side_effect = FileNotFoundError("Command not found")
-
-        from src.oaDeviceAPI.platforms.macos.services.security import check_sip_status
+        fake_run.result = FileNotFoundError("Command not found")
 
         status = check_sip_status()
 
@@ -476,13 +719,29 @@ class TestMacOSSecurityService:
         assert "error" in status
 
 
+    def test_check_secure_boot_apple_silicon(self, monkeypatch, fake_run):
+        """Test Apple Silicon is detected from the CPU brand sysctl."""
+        monkeypatch.setattr(security, "sysctl_str", lambda name: "Apple M2")
+
+        status = security.check_secure_boot()
+
+        assert status["enabled"] is True
+        assert status["details"]["platform"] == "Apple Silicon"
+
+    def test_sysctl_str_falls_back_to_command(self, monkeypatch, fake_run):
+        """Test sysctl values are read with the sysctl command when libc is unavailable."""
+        monkeypatch.setattr(utils, "_libc", lambda: None)
+        fake_run.result = completed("Apple M2")
+
+        assert utils.sysctl_str("machdep.cpu.brand_string") == "Apple M2"
+        assert fake_run.calls[0][0] == ["sysctl", "-n", "machdep.cpu.brand_string"]
+
 class TestMacOSActionsService:
     """Test macOS action services."""
 
-    @patch("subprocess.run")
-    async def test_reboot_system_success(self, mock_run):
+    async def test_reboot_system_success(self, fake_run):
         """Test successful system reboot."""
-        mock_run.return_value = Mock(returncode=0)
+        fake_run.result = completed()
 
         from src.oaDeviceAPI.platforms.macos.services.actions import reboot_system
 
@@ -490,14 +749,13 @@ class TestMacOSActionsService:
 
         assert result["success"] is True
         assert "reboot" in result["message"].lower()
-        mock_run.assert_called_once()
-        assert "sudo" in mock_run.call_args[0][0]
-        assert "shutdown" in mock_run.call_args[0][0]
+        assert len(fake_run.calls) == 1
+        assert "sudo" in fake_run.calls[0][0]
+        assert "shutdown" in fake_run.calls[0][0]
 
-    @patch("subprocess.run")
-    async def test_reboot_system_failure(self, mock_run):
+    async def test_reboot_system_failure(self, fake_run):
         """Test system reboot failure."""
-        mock_run.side_effect = subprocess.SubprocessError("Permission denied")
+        fake_run.result = subprocess.SubprocessError("Permission denied")
 
         from src.oaDeviceAPI.platforms.macos.services.actions import reboot_system
 
@@ -506,7 +764,7 @@ class TestMacOSActionsService:
         assert result["success"] is False
         assert "error" in result
 
-    @patch("src.oaDeviceAPI.core.platform.platform_manager.restart_service")
+    @patch("src.oaDeviceAPI.core.platform.platform_manager.restart_service", autospec=True)
     async def test_restart_tracker_success(self, mock_restart):
         """Test successful tracker restart."""
         mock_restart.return_value = True
@@ -519,7 +777,7 @@ class TestMacOSActionsService:
         assert "tracker" in result["message"].lower()
         mock_restart.assert_called_once()
 
-    @patch("src.oaDeviceAPI.core.platform.platform_manager.restart_service")
+    @patch("src.oaDeviceAPI.core.platform.platform_manager.restart_service", autospec=True)
     async def test_restart_tracker_failure(self, mock_restart):
         """Test tracker restart failure."""
         mock_restart.return_value = False
@@ -535,86 +793,37 @@ class TestMacOSActionsService:
 class TestMacOSDisplayService:
     """Test macOS display services."""
 
-    @patch("subprocess.run")
-    def test_get_display_info_success(self, mock_run):
-        """Test successful display information gathering."""
-        display_output = '''Graphics/Displays:
-
-    Intel Iris Plus Graphics 655:
-
-      Chipset Model: Intel Iris Plus Graphics 655
-      Type: GPU
-      Bus: Built-In
-      VRAM (Dynamic, Max): 1536 MB
-      Vendor: Intel
-      Device ID: 0x3ea5
-      Revision ID: 0x0001
-      Metal: Supported, feature set macOS GPUFamily2 v1
-
-    Displays:
-
-        Color LCD:
-          Display Type: Built-in Liquid Retina Display  
-          Resolution: 2560 x 1600 Retina
-          UI Looks like: 1280 x 800 @ 227.00 PPI
-          Main Display: Yes
-          Mirror: Off
-          Online: Yes
-          Automatically Adjust Brightness: No
-'''
-
-        mock_run.return_value = Mock(returncode=0, stdout=display_output)
-
-        from src.oaDeviceAPI.platforms.macos.services.display import get_display_info
+    @pytest.mark.parametrize(
+        "result,connected,reports_error",
+        [
+            (completed(DISPLAY_OUTPUT), True, False),
+            (completed("Graphics/Displays:\n\nNo displays found."), False, False),
+            (subprocess.SubprocessError("Display command failed"), False, True),
+        ],
+        ids=["success", "no_displays", "command_failure"],
+    )
+    def test_get_display_info(self, fake_run, result, connected, reports_error):
+        """Test display information gathering across system_profiler outcomes."""
+        fake_run.result = result
 
         info = get_display_info()
 
-        assert info["connected"] is True
-        assert len(info["displays"]) > 0
-        assert info["primary_display"] is not None
-        assert "resolution" in info["primary_display"]
-
-    @patch("subprocess.run")
-    def test_get_display_info_no_displays(self, mock_run):
-        """Test display info when no displays are connected."""
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="Graphics/Displays:\n\nNo displays found."
-        )
-
-        from src.oaDeviceAPI.platforms.macos.services.display import get_display_info
-
-        info = get_display_info()
-
-        assert info["connected"] is False
-        assert len(info["displays"]) == 0
-        assert info["primary_display"] is None
-
-    @patch("subprocess.run")
-    def test_get_display_info_command_failure(self, mock_run):
-        """Test display info when command fails."""
-        mock_run.side_effect = subprocess.SubprocessError("Display command failed")
-
-        from src.oaDeviceAPI.platforms.macos.services.display import get_display_info
-
-        info = get_display_info()
-
-        assert info["connected"] is False
-        assert info["displays"] == []
-        assert "error" in info
+        assert info["connected"] is connected
+        assert bool(info["displays"]) is connected
+        if connected:
+            assert "resolution" in info["primary_display"]
+        else:
+            assert info["primary_display"] is None
+        if reports_error:
+            assert "error" in info
 
 
 class TestMacOSUtilsService:
     """Test macOS utility services."""
 
-    @patch("subprocess.run")
-    def test_execute_command_success(self, mock_run):
+    def test_execute_command_success(self, fake_run):
         """Test successful command execution."""
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="command output",
-            stderr=""
-        )
+        fake_run.result = completed("command output")
 
         from src.oaDeviceAPI.platforms.macos.services.utils import execute_command
 
@@ -624,14 +833,9 @@ class TestMacOSUtilsService:
         assert result["stdout"] == "command output"
         assert result["returncode"] == 0
 
-    @patch("subprocess.run")
-    def test_execute_command_failure(self, mock_run):
+    def test_execute_command_failure(self, fake_run):
         """Test command execution failure."""
-        mock_run.return_value = Mock(
-            returncode=1,
-            stdout="",
-            stderr="command error"
-        )
+        fake_run.result = completed(returncode=1, stderr="command error")
 
         from src.oaDeviceAPI.platforms.macos.services.utils import execute_command
 
@@ -641,10 +845,9 @@ class TestMacOSUtilsService:
         assert result["stderr"] == "command error"
         assert result["returncode"] == 1
 
-    @patch("subprocess.run")
-    def test_execute_command_timeout(self, mock_run):
+    def test_execute_command_timeout(self, fake_run):
         """Test command execution timeout."""
-        mock_run.side_effect = subprocess.TimeoutExpired("sleep", 30)
+        fake_run.result = subprocess.TimeoutExpired("sleep", 30)
 
         from src.oaDeviceAPI.platforms.macos.services.utils import execute_command
 
@@ -653,62 +856,31 @@ class TestMacOSUtilsService:
         assert result["success"] is False
         assert "timeout" in result["error"].lower()
 
-    def test_execute_command_security_validation(self):
-        """Test that command execution validates input for security."""
-        from src.oaDeviceAPI.platforms.macos.services.utils import execute_command
-
-        # Test potentially dangerous commands
-        dangerous_commands = [
+    @pytest.mark.parametrize(
+        "cmd",
+        [
             ["rm", "-rf", "/"],
             ["sudo", "rm", "-rf", "/"],
             ["; rm -rf /"],
             ["$(whoami)"],
-        ]
-
-        for cmd in dangerous_commands:
-            # Should not execute dangerous commands without proper validation
-            with patch("subprocess.run") as mock_run:
-                mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+        ],
+    )
+    def test_execute_command_security_validation(self, fake_run, cmd):
+        """Test that command execution validates input for security."""
+        from src.oaDeviceAPI.platforms.macos.services.utils import execute_command
 
-                result = execute_command(cmd)
+        # Should not execute dangerous commands without proper validation
+        execute_command(cmd)
 
-                # Commands should be passed as arrays (safer than shell=True)
-                if mock_run.called:
-                    call_args = mock_run.call_args
-                    # Should not use shell=True for safety
-                    assert call_args.kwargs.get("shell", False) is False
+        # Commands should be passed as arrays (safer than shell=True)
+        assert all(not kwargs.get("shell", False) for _, kwargs in fake_run.calls)
 
 
 class TestMacOSStandardizedMetrics:
     """Test macOS standardized metrics service."""
 
-    @patch("psutil.cpu_percent")
-    @patch("psutil.virtual_memory")
-    @patch("psutil.disk_usage")
-    @patch("psutil.net_io_counters")
-    def test_get_standardized_metrics_success(self, mock_net, mock_disk, mock_memory, mock_cpu):
+    def test_get_standardized_metrics_success(self, fake_psutil):
         """Test successful standardized metrics gathering."""
-        # Mock psutil returns
-        mock_cpu.return_value = 25.5
-        mock_memory.return_value = Mock(
-            total=8589934592,
-            used=3885481984,
-            available=4704452608,
-            percent=45.2
-        )
-        mock_disk.return_value = Mock(
-            total=499963174912,
-            used=338973696512,
-            free=160989478400,
-            percent=67.8
-        )
-        mock_net.return_value = Mock(
-            bytes_sent=1024000,
-            bytes_recv=2048000,
-            packets_sent=500,
-            packets_recv=750
-        )
-
         from src.oaDeviceAPI.platforms.macos.services.standardized_metrics import (
             get_standardized_metrics,
         )
@@ -722,6 +894,28 @@ class TestMacOSStandardizedMetrics:
         assert metrics["network"]["bytes_sent"] == 1024000
         assert metrics["network"]["bytes_received"] == 2048000
 
+    def test_cpu_usage_sampled_once_per_ttl(self, monkeypatch, fake_psutil, fake_platform):
+        """Test repeated CPU metric reads reuse one blocking psutil sample."""
+        from src.oaDeviceAPI.core.metrics import MacOSMetricsCollector
+
+        samples = []
+
+        def _cpu_percent(*args, **kwargs):
+            samples.append(kwargs.get("interval"))
+            return [25.0, 26.0]
+
+        monkeypatch.setattr(psutil, "cpu_percent", _cpu_percent)
+        collector = MacOSMetricsCollector()
+
+        for _ in range(100):
+            assert collector.get_standardized_cpu_metrics().usage_percent == 25.5
+
+        assert samples == [1]
+
+        collector._cache_ttl = 0  # Every read is now stale
+        collector.get_standardized_cpu_metrics()
+        assert len(samples) == 2
+
     @patch("psutil.cpu_count")
     @patch("platform.machine")
     def test_get_cpu_info_details(self, mock_machine, mock_cpu_count):
@@ -743,12 +937,12 @@ class TestMacOSStandardizedMetrics:
     def test_get_network_details(self, mock_addrs, mock_stats):
         """Test detailed network information gathering."""
         mock_stats.return_value = {
-            "en0": Mock(isup=True, speed=1000),
-            "en1": Mock(isup=False, speed=100)
+            "en0": SimpleNamespace(isup=True, speed=1000),
+            "en1": SimpleNamespace(isup=False, speed=100)
         }
         mock_addrs.return_value = {
-            "en0": [Mock(family=2, address="192.168.1.100")],
-            "en1": [Mock(family=2, address="192.168.1.101")]
+            "en0": [SimpleNamespace(family=2, address="192.168.1.100")],
+            "en1": [SimpleNamespace(family=2, address="192.168.1.101")]
         }
 
         from src.oaDeviceAPI.platforms.macos.services.standardized_metrics import (
@@ -763,69 +957,54 @@ class TestMacOSStandardizedMetrics:
         assert network_info["interfaces"]["en0"]["speed"] == 1000
 
 
-class TestMacOSServiceIntegration:
+class TestMacOSServiceErrorHandling:
     """Test error handling across macOS services."""
 
-    def test_service_with_missing_dependencies(self):
+    def test_service_with_missing_dependencies(self, fake_psutil):
         """Test service behavior when dependencies are missing."""
         # Test with missing psutil (hypothetical)
-        with patch("psutil.cpu_percent", side_effect=ImportError("psutil not available")):
-            from src.oaDeviceAPI.platforms.macos.services.standardized_metrics import (
-                get_standardized_metrics,
-            )
-
-            # Should handle missing dependencies gracefully
-            try:
-                metrics = get_standardized_metrics()
-                # If it doesn't raise, should have fallback values
-                assert isinstance(metrics, dict)
-            except ImportError:
-                # Or it should raise a clear error
-                pass
-
-    @patch("subprocess.run")
-    def test_service_with_corrupted_output(self, mock_run):
+        fake_psutil.cpu_percent = ImportError("psutil not available")
+
+        # Should handle missing dependencies gracefully
+        try:
+            metrics = get_system_metrics()
+            # If it doesn't raise, should have fallback values
+            assert isinstance(metrics, dict)
+        except ImportError:
+            # Or it should raise a clear error
+            pass
+
+    def test_service_with_corrupted_output(self, fake_run):
         """Test service behavior with corrupted command output."""
         # Test binary/corrupted output
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout=b"\x00\x01\x02\xff\xfe"  # Binary data
-        )
-
-        from src.oaDeviceAPI.platforms.macos.services.system import get_device_info
+        fake_run.result = completed(b"\x00\x01\x02\xff\xfe")  # Binary data
 
         info = get_device_info()
 
-        # Should handle corrupted output gracefully
+        # Should handle corrupted output gracefully; an unreadable display
+        # probe falls back to headless
         assert isinstance(info, dict)
-        assert info["model"] == "Unknown"  # Should fall back to unknown
+        assert info["is_headless"] is True
 
-    def test_service_performance_under_load(self):
+    def test_service_performance_under_load(self, fake_run, fake_psutil):
         """Test service performance under simulated load."""
-        import time
-
-
-        with patch("subprocess.run") as mock_run, \
-             patch("socket.gethostname", return_value="test"), \
-             patch("psutil.boot_time", return_value=time.time()), \
-             patch("platform.platform", return_value="macOS"):
+        fake_run.result = completed("kernel info")
 
-            mock_run.return_value = Mock(returncode=0, stdout="kernel info")
+        # Multiple rapid calls, timed individually on the high-resolution
+        # clock; the first two warm the caches and are not measured
+        samples = []
+        results = []
+        for _ in range(22):
+            start = time.perf_counter_ns()
+            results.append(get_system_metrics())
+            samples.append(time.perf_counter_ns() - start)
 
-            # Multiple rapid calls
-            start_time = time.time()
-            results = []
-            for _ in range(20):
-                results.append(get_system_metrics())
-            end_time = time.time()
+        # Typical call should complete quickly (< 50 ms)
+        assert statistics.median(samples[2:]) < 50_000_000
 
-            # Should complete quickly (< 1 second for 20 calls)
-            assert (end_time - start_time) < 1.0
-
-            # All results should be valid
-            for result in results:
-                assert isinstance(result, dict)
-                assert "hostname" in result
+        # All results should be valid
+        for result in results:
+            _SystemMetrics.model_validate(result)
 
 
 class TestMacOSServiceIntegration:
@@ -875,3 +1054,110 @@ class TestMacOSServiceIntegration:
         for section in expected_sections:
             if section in health_data:
                 assert health_data[section] is not None
+
+    async def test_health_check_runs_collectors_concurrently(self, monkeypatch):
+        """Test the /health collectors overlap instead of running back to back."""
+        collectors = [
+            "get_standardized_health_metrics",
+            "get_standardized_system_info",
+            "get_standardized_device_info",
+            "get_standardized_version_info",
+            "get_standardized_capabilities",
+            "get_cached_deployment_info",
+            "get_cached_display_info",
+            "check_tracker_status",
+            "get_cached_device_info",
+        ]
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def _collector(result):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+            return result
+
+        model = SimpleNamespace(hostname="mac0001", dict=lambda: {})
+        results = {
+            "check_tracker_status": {"healthy": True, "service_status": "active"},
+            "get_cached_deployment_info": {},
+            "get_cached_display_info": {"displays": []},
+            "get_cached_device_info": {"is_headless": False},
+        }
+        for name in collectors:
+            def fake(result=results.get(name, model)):
+                return _collector(result)
+
+            fake.cache_info = lambda: None  # read back into _cache_info
+            monkeypatch.setattr(health_router, name, fake)
+
+        response = await health_router.health_check()
+
+        assert response["status"] == "online"
+        assert response["hostname"] == "mac0001"
+        # Run back to back, no two collectors would ever be active together
+        assert max(peak) > 1
+
+    async def test_health_stream_sends_sections_as_they_finish(self, monkeypatch):
+        """Test /health/stream emits one NDJSON line per section, fastest first."""
+        def _slow_display():
+            time.sleep(0.1)
+            return {"displays": []}
+
+        def _broken_deployment():
+            raise RuntimeError("deployment unavailable")
+
+        model = SimpleNamespace(dict=lambda: {})
+        monkeypatch.setattr(health_router, "check_tracker_status", lambda: {"healthy": True, "service_status": "active"})
+        for name in (
+            "get_standardized_health_metrics",
+            "get_standardized_system_info",
+            "get_standardized_device_info",
+            "get_standardized_version_info",
+            "get_standardized_capabilities",
+        ):
+            monkeypatch.setattr(health_router, name, lambda: model)
+        monkeypatch.setattr(health_router, "get_cached_deployment_info", _broken_deployment)
+        monkeypatch.setattr(health_router, "get_cached_display_info", _slow_display)
+
+        response = await health_router.health_stream()
+        lines = [json.loads(chunk) async for chunk in response.body_iterator]
+
+        assert response.media_type == "application/x-ndjson"
+        assert {line["section"] for line in lines} == set(health_router._STREAM_SECTIONS)
+        assert lines[-1] == {"section": "display", "data": {"displays": []}}
+        sections = {line["section"]: line for line in lines}
+        assert sections["status"]["data"]["status"] == "online"
+        assert sections["deployment"]["error"] == "deployment unavailable"
+
+    async def test_health_check_reports_stalled_collector_as_unknown(self, monkeypatch):
+        """Test a collector that overruns its time budget doesn't hold up /health."""
+        release = threading.Event()
+        model = SimpleNamespace(hostname="mac0001", dict=lambda: {})
+        collectors = {
+            "get_standardized_health_metrics": lambda: model,
+            "get_standardized_system_info": lambda: model,
+            "get_standardized_device_info": lambda: model,
+            "get_standardized_version_info": lambda: model,
+            "get_standardized_capabilities": lambda: model,
+            "get_cached_deployment_info": lambda: release.wait(5) and {},
+            "get_cached_display_info": lambda: {"displays": []},
+            "check_tracker_status": lambda: {"healthy": True, "service_status": "active"},
+            "get_cached_device_info": lambda: {"is_headless": False},
+        }
+        for name, collector in collectors.items():
+            collector.cache_info = lambda: None
+            monkeypatch.setattr(health_router, name, collector)
+        monkeypatch.setattr(health_router, "HEALTH_COLLECTOR_TIMEOUT", 0.05)
+
+        try:
+            response = await health_router.health_check()
+        finally:
+            release.set()
+
+        assert response["status"] == "online"
+        assert response["deployment"] == {"status": "unknown"}